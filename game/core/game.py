@@ -36,6 +36,8 @@ class Game:
         
         self.clock = pygame.time.Clock()
         self.running = True
+        # Screen whose draw() last reached the display; see run()
+        self._drawn_screen = None
         
         # Initialize API manager
         print(f"Инициализация {GAME_TITLE}...")
@@ -123,6 +125,9 @@ class Game:
                 if event.type == pygame.QUIT:
                     self.running = False
                     continue
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    # Window contents were lost; next draw must repaint fully
+                    self._drawn_screen = None
                 if event.type == pygame.VIDEORESIZE:
                     # Window resized or maximized; keep windowed mode
                     if not (self.screen.get_flags() & pygame.FULLSCREEN):
@@ -140,10 +145,18 @@ class Game:
                 if update_result:
                     self._handle_screen_result(update_result)
 
-            # Draw
-            if self.current_screen:
-                self.current_screen.draw()
-            pygame.display.flip()
+            # Draw (screens may return changed rects instead of None)
+            screen = self.current_screen
+            dirty = None
+            if screen:
+                if screen is not self._drawn_screen:
+                    screen.invalidate()
+                    self._drawn_screen = screen
+                dirty = screen.draw()
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
             
             # FPS limit
             self.clock.tick(FPS)
@@ -13,7 +13,7 @@ the string labels used in handle_drop().
 """
 from __future__ import annotations
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
 from core import data as game_data
 from core.entities.base import ID
@@ -50,6 +50,14 @@ class TradeState:
         # Items staged for exchange
         self.player_barter: List[GameEquipment] = []
         self.npc_barter:    List[GameEquipment] = []
+        # id(item) of everything in the lists above, kept in sync by _add/_remove_barter
+        self.player_barter_ids: Set[int] = set()
+        self.npc_barter_ids:    Set[int] = set()
+        # Bumped on every change to either barter list; UI caches compare against it
+        self.barter_version: int = 0
+        # Running price totals of the offered items (coins excluded)
+        self._player_items_value: int = 0
+        self._npc_items_value:    int = 0
 
         # Coin offers
         self.player_coins_offer: int = 0
@@ -62,16 +70,40 @@ class TradeState:
         # Which coin field is currently focused ("player" | "npc" | "")
         self.coin_active: str = ""
 
+        # slot_key → equipped item, rebuilt when the inventory version changes
+        self._slot_map: Dict[str, GameEquipment] = {}
+        self._slot_map_version: Optional[tuple] = None
+
+        # "player" | "npc" → (inventory version, filtered item list); see _cached_view()
+        self._inv_views: Dict[str, Tuple[tuple, List[GameEquipment]]] = {}
+
+        # (source, target) → drop handler; see handle_drop()
+        self._drop_rules: Dict[Tuple[str, str], Callable[[GameEquipment], None]] = {
+            (PANEL_PLAYER_INV,    PANEL_PLAYER_BARTER): self._offer_player_item,
+            (PANEL_PLAYER_EQUIP,  PANEL_PLAYER_BARTER): self._offer_equipped_item,
+            (PANEL_PLAYER_BARTER, PANEL_PLAYER_INV):    self._withdraw_player_item,
+            (PANEL_PLAYER_BARTER, PANEL_EQUIP):         self._withdraw_player_item,
+            (PANEL_NPC_INV,       PANEL_NPC_BARTER):    self._offer_npc_item,
+            (PANEL_NPC_BARTER,    PANEL_NPC_INV):       self._withdraw_npc_item,
+        }
+
     def reset(self, npc_id: ID) -> None:
         """Start a fresh session with the given NPC."""
         self.npc_id = npc_id
         self.player_barter.clear()
         self.npc_barter.clear()
+        self.player_barter_ids.clear()
+        self.npc_barter_ids.clear()
+        self._player_items_value = 0
+        self._npc_items_value    = 0
+        self.barter_version     += 1
         self.player_coins_offer = 0
         self.npc_coins_offer    = 0
         self.coin_buf_player    = ""
         self.coin_buf_npc       = ""
         self.coin_active        = ""
+        self._slot_map_version  = None
+        self._inv_views.clear()
 
     # ------------------------------------------------------------------
     # GAME-STATE ACCESSORS
@@ -89,43 +121,72 @@ class TradeState:
 
     def item_in_slot(self, slot_key: str) -> Optional[GameEquipment]:
         """Return the player's item occupying *slot_key*, or None."""
+        return self.slot_map().get(slot_key)
+
+    def slot_map(self) -> Dict[str, GameEquipment]:
+        """
+        slot key → equipped item, rebuilt only when the player's inventory
+        changes.  Callers looking up several slots should fetch this once.
+        """
         player = self.get_player()
         if not player or not getattr(player, "inventory", None):
-            return None
-        for it in player.inventory:
+            return {}
+        inv = player.inventory
+        version = (id(inv), len(inv), id(inv[0]), id(inv[-1]))
+        if version != self._slot_map_version:
+            self._slot_map = self._build_slot_map(inv)
+            self._slot_map_version = version
+        return self._slot_map
+
+    @staticmethod
+    def _build_slot_map(inv: list) -> Dict[str, GameEquipment]:
+        """One inventory pass; the first item found for a slot wins."""
+        slots: Dict[str, GameEquipment] = {}
+        for it in inv:
             if it is None or not isinstance(it, GameEquipment):
                 continue
-            if slot_key == "left_hand"  and it.equipped_left_hand:
-                return it
-            if slot_key == "right_hand" and it.equipped_right_hand:
-                return it
-            if slot_key not in ("left_hand", "right_hand") and it.equipped_slot == slot_key:
-                return it
-        return None
+            if it.equipped_left_hand:
+                slots.setdefault("left_hand", it)
+            if it.equipped_right_hand:
+                slots.setdefault("right_hand", it)
+            if it.equipped_slot and it.equipped_slot not in ("left_hand", "right_hand"):
+                slots.setdefault(it.equipped_slot, it)
+        return slots
 
     def player_inv_items(self) -> List[GameEquipment]:
         player = self.get_player()
         if not player or not getattr(player, "inventory", None):
             return []
-        return [it for it in player.inventory
-                if it is not None and isinstance(it, GameEquipment)]
+        return self._cached_view("player", player.inventory)
 
     def npc_inv_items(self) -> List[GameEquipment]:
         npc = self.get_npc()
         if not npc or not getattr(npc, "inventory", None):
             return []
-        return [it for it in npc.inventory
-                if it is not None and isinstance(it, GameEquipment)]
+        return self._cached_view("npc", npc.inventory)
+
+    def _cached_view(self, key: str, inv: list) -> List[GameEquipment]:
+        """
+        GameEquipment-only view of *inv*, refiltered only when the inventory
+        changes identity, length or end items.  Callers must not mutate it.
+        """
+        version = (id(inv), len(inv), id(inv[0]), id(inv[-1]))
+        cached = self._inv_views.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        view = [it for it in inv if it is not None and isinstance(it, GameEquipment)]
+        self._inv_views[key] = (version, view)
+        return view
 
     # ------------------------------------------------------------------
     # BARTER VALUE CALCULATIONS
     # ------------------------------------------------------------------
 
     def player_barter_value(self) -> int:
-        return sum((it.price or 0) for it in self.player_barter) + self.player_coins_offer
+        return self._player_items_value + self.player_coins_offer
 
     def npc_barter_value(self) -> int:
-        return sum((it.price or 0) for it in self.npc_barter) + self.npc_coins_offer
+        return self._npc_items_value + self.npc_coins_offer
 
     def is_balanced(self) -> bool:
         """True when at least one item is offered and both sides' totals match."""
@@ -136,11 +197,35 @@ class TradeState:
     # BARTER OPERATIONS
     # ------------------------------------------------------------------
 
+    def coin_input(self, ch: str) -> bool:
+        """
+        Apply one keystroke to the focused coin field: an ASCII digit appends
+        (up to 9 digits), "\b" erases the last one.  The offer is updated
+        arithmetically rather than re-parsed.  Returns True if anything changed.
+        """
+        if self.coin_active == "player":
+            buf, offer = self.coin_buf_player, self.player_coins_offer
+        elif self.coin_active == "npc":
+            buf, offer = self.coin_buf_npc, self.npc_coins_offer
+        else:
+            return False
+        if ch == "\b":
+            if not buf:
+                return False
+            buf, offer = buf[:-1], offer // 10
+        elif len(ch) == 1 and "0" <= ch <= "9" and len(buf) < 9:
+            buf, offer = buf + ch, offer * 10 + (ord(ch) - 48)
+        else:
+            return False
+        if self.coin_active == "player":
+            self.coin_buf_player, self.player_coins_offer = buf, offer
+        else:
+            self.coin_buf_npc, self.npc_coins_offer = buf, offer
+        return True
+
     def balance(self) -> None:
         """Auto-fill coin offers so both sides' totals become equal."""
-        p_items = sum((it.price or 0) for it in self.player_barter)
-        n_items = sum((it.price or 0) for it in self.npc_barter)
-        diff = p_items - n_items
+        diff = self._player_items_value - self._npc_items_value
         if diff > 0:
             # player offers more goods → NPC compensates with coins
             self.npc_coins_offer    = diff
@@ -166,9 +251,9 @@ class TradeState:
         npc_inv    = getattr(npc,    "inventory", None) if npc else None
 
         # Player's offered items → NPC
-        for item in list(self.player_barter):
-            if player_inv:
-                self.inv_remove(player_inv, item)
+        if player_inv:
+            self.inv_remove_all(player_inv, self.player_barter_ids)
+        for item in self.player_barter:
             item.equipped            = False
             item.equipped_left_hand  = False
             item.equipped_right_hand = False
@@ -177,9 +262,9 @@ class TradeState:
                 npc_inv.append(item)
 
         # NPC's offered items → player
-        for item in list(self.npc_barter):
-            if npc_inv is not None:
-                self.inv_remove(npc_inv, item)
+        if npc_inv is not None:
+            self.inv_remove_all(npc_inv, self.npc_barter_ids)
+        for item in self.npc_barter:
             if player_inv is not None:
                 player_inv.append(item)
 
@@ -194,41 +279,77 @@ class TradeState:
 
         self.player_barter.clear()
         self.npc_barter.clear()
+        self.player_barter_ids.clear()
+        self.npc_barter_ids.clear()
+        self._player_items_value = 0
+        self._npc_items_value    = 0
+        self.barter_version     += 1
         self.player_coins_offer = 0
         self.npc_coins_offer    = 0
         self.coin_buf_player    = ""
         self.coin_buf_npc       = ""
+        self._slot_map_version  = None
+        self._inv_views.clear()
 
     def handle_drop(self, item: GameEquipment, source: str, target: str) -> None:
         """
         Route a drag-drop move given string panel labels.
 
         source / target must be one of the PANEL_* constants defined above.
+        Pairs missing from the drop-rule table are ignored.
         """
-        if target == PANEL_PLAYER_BARTER:
-            if source in (PANEL_PLAYER_INV, PANEL_PLAYER_EQUIP) \
-                    and not self.barter_contains(self.player_barter, item):
-                if source == PANEL_PLAYER_EQUIP:
-                    item.equipped            = False
-                    item.equipped_left_hand  = False
-                    item.equipped_right_hand = False
-                    item.equipped_slot       = None
-                self.player_barter.append(item)
-
-        elif target in (PANEL_PLAYER_INV, PANEL_EQUIP):
-            if source == PANEL_PLAYER_BARTER \
-                    and self.barter_contains(self.player_barter, item):
-                self.barter_remove(self.player_barter, item)
-
-        elif target == PANEL_NPC_BARTER:
-            if source == PANEL_NPC_INV \
-                    and not self.barter_contains(self.npc_barter, item):
-                self.npc_barter.append(item)
-
-        elif target == PANEL_NPC_INV:
-            if source == PANEL_NPC_BARTER \
-                    and self.barter_contains(self.npc_barter, item):
-                self.barter_remove(self.npc_barter, item)
+        handler = self._drop_rules.get((source, target))
+        if handler is not None:
+            handler(item)
+
+    def _offer_player_item(self, item: GameEquipment) -> None:
+        self._add_barter("player", item)
+
+    def _offer_equipped_item(self, item: GameEquipment) -> None:
+        if self.barter_contains(self.player_barter_ids, item):
+            return
+        item.equipped            = False
+        item.equipped_left_hand  = False
+        item.equipped_right_hand = False
+        item.equipped_slot       = None
+        self._slot_map_version   = None
+        self._add_barter("player", item)
+
+    def _withdraw_player_item(self, item: GameEquipment) -> None:
+        self._remove_barter("player", item)
+
+    def _offer_npc_item(self, item: GameEquipment) -> None:
+        self._add_barter("npc", item)
+
+    def _withdraw_npc_item(self, item: GameEquipment) -> None:
+        self._remove_barter("npc", item)
+
+    def _barter_side(self, side: str) -> Tuple[List[GameEquipment], Set[int]]:
+        if side == "player":
+            return self.player_barter, self.player_barter_ids
+        return self.npc_barter, self.npc_barter_ids
+
+    def _add_barter(self, side: str, item: GameEquipment) -> None:
+        lst, ids = self._barter_side(side)
+        if id(item) not in ids:
+            lst.append(item)
+            ids.add(id(item))
+            self.barter_version += 1
+            self._add_items_value(side, item.price or 0)
+
+    def _remove_barter(self, side: str, item: GameEquipment) -> None:
+        lst, ids = self._barter_side(side)
+        if id(item) in ids:
+            ids.discard(id(item))
+            self.barter_remove(lst, item)
+            self.barter_version += 1
+            self._add_items_value(side, -(item.price or 0))
+
+    def _add_items_value(self, side: str, delta: int) -> None:
+        if side == "player":
+            self._player_items_value += delta
+        else:
+            self._npc_items_value += delta
 
     # ------------------------------------------------------------------
     # IDENTITY HELPERS
@@ -236,8 +357,8 @@ class TradeState:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def barter_contains(lst: List[GameEquipment], item: GameEquipment) -> bool:
-        return any(it is item for it in lst)
+    def barter_contains(ids: Set[int], item: GameEquipment) -> bool:
+        return id(item) in ids
 
     @staticmethod
     def barter_remove(lst: List[GameEquipment], item: GameEquipment) -> None:
@@ -252,3 +373,8 @@ class TradeState:
             if it is item:
                 del inv[i]
                 return
+
+    @staticmethod
+    def inv_remove_all(inv: list, ids: Set[int]) -> None:
+        """Drop every item whose id is in *ids* from *inv* in a single pass."""
+        inv[:] = [it for it in inv if id(it) not in ids]
@@ -34,5 +34,13 @@ class BaseScreen(ABC):
         
     @abstractmethod
     def draw(self):
-        """Draw the screen"""
+        """Draw the screen.
+
+        Return None to have the whole display flipped, or a list of changed
+        rects for a partial pygame.display.update (empty list: nothing changed).
+        """
+        pass
+
+    def invalidate(self):
+        """Force a full repaint on the next draw() (screen shown again, window exposed)."""
         pass
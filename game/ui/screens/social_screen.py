@@ -25,6 +25,7 @@ from enum import Enum
 from typing import List, Optional, TYPE_CHECKING, Union
 
 import pygame
+import pygame.freetype
 
 from .base_screen import BaseScreen
 from ..colors import *
@@ -40,12 +41,32 @@ SB_PAD = 4
 PORTRAIT_W_RATIO = 0.18
 PORTRAIT_H_RATIO = 0.40
 BTN_H_RATIO = 0.07
+# pygame.font shrinks its bundled default font by this factor; freetype does not
+FT_DEFAULT_FONT_RATIO = 0.6875
 
 
 def _sc(v: float, s: float) -> int:
     return max(1, int(v * s))
 
 
+_ROUNDED_CACHE: dict = {}
+# One layout uses a handful of shapes; resizes would otherwise keep old sizes alive
+_ROUNDED_CACHE_MAX = 16
+
+
+def _rounded(w: int, h: int, color: tuple, border: int, radius: int) -> pygame.Surface:
+    """Rounded rect (filled when border == 0) pre-rasterized once per shape."""
+    key = (w, h, color, border, radius)
+    surf = _ROUNDED_CACHE.get(key)
+    if surf is None:
+        if len(_ROUNDED_CACHE) >= _ROUNDED_CACHE_MAX:
+            _ROUNDED_CACHE.clear()
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), width=border, border_radius=radius)
+        _ROUNDED_CACHE[key] = surf
+    return surf
+
+
 # ── Chat entry types ─────────────────────────────────────────────────────────
 
 class ChatRole(Enum):
@@ -87,6 +108,7 @@ class SocialScreen(BaseScreen):
         super().__init__(screen)
         self._state          = SocialState()
         self._portrait_cache: dict = {}
+        self._name_surf_cache: dict = {}   # portrait label → rendered surface
 
         # Chat entries (replaces flat string list)
         self._chat_entries: List[ChatEntry] = []
@@ -115,6 +137,8 @@ class SocialScreen(BaseScreen):
     def set_npc(self, npc_id: ID) -> None:
         """Set the NPC for the upcoming conversation (does NOT start the thread)."""
         self._state.reset(npc_id)
+        if len(self._name_surf_cache) > 12:
+            self._name_surf_cache.clear()
         self._chat_entries.clear()
         self._chat_scroll = 0
 
@@ -176,6 +200,12 @@ class SocialScreen(BaseScreen):
         self.font       = pygame.font.Font(None, _sc(26, s))
         self.small_font = pygame.font.Font(None, _sc(22, s))
         self.title_font = pygame.font.Font(None, _sc(30, s))
+        # Chat text goes through freetype: render_to() draws straight into the
+        # chat canvas without allocating an intermediate surface per line.
+        self.chat_font = pygame.freetype.Font(None, _sc(22, s) * FT_DEFAULT_FONT_RATIO)
+        self.chat_font.pad = True
+        # Per-character advance widths for chat_font, filled lazily by _char_w()
+        self._char_widths: dict = {}
 
         margin = _sc(16, s)
         gap    = _sc(10, s)
@@ -206,6 +236,8 @@ class SocialScreen(BaseScreen):
 
         chat_h = content_h - input_h - send_gap
         self._chat_rect  = pygame.Rect(chat_x, content_top, chat_w, chat_h)
+        # freetype ignores the clip rect, so chat lines are drawn into a subsurface
+        self._chat_canvas = self.screen.subsurface(self._chat_rect)
 
         input_y  = content_top + chat_h + send_gap
         input_w  = chat_w - send_w - send_gap
@@ -233,22 +265,36 @@ class SocialScreen(BaseScreen):
         self._chat_entries.append(ChatEntry(text, role))
         self._chat_scroll = self._chat_max_scroll()
 
+    def _char_w(self, ch: str) -> float:
+        w = self._char_widths.get(ch)
+        if w is None:
+            metrics = self.chat_font.get_metrics(ch)
+            w = metrics[0][4] if metrics and metrics[0] else 0.0
+            self._char_widths[ch] = w
+        return w
+
     def _wrap_text(self, text: str, max_w: int) -> List[str]:
+        # Word widths are sums of cached glyph advances, so the font is only
+        # queried the first time a character is seen.
+        cw      = self._char_w
+        space_w = cw(" ")
         lines: List[str] = []
         for paragraph in text.split("\n"):
             words = paragraph.split()
             if not words:
                 lines.append("")
                 continue
-            cur = ""
+            cur, cur_w = "", 0.0
             for word in words:
-                trial = (cur + " " + word).strip() if cur else word
-                if self.small_font.size(trial)[0] <= max_w:
-                    cur = trial
+                word_w = sum(cw(c) for c in word)
+                if not cur:
+                    cur, cur_w = word, word_w
+                elif cur_w + space_w + word_w <= max_w:
+                    cur   += " " + word
+                    cur_w += space_w + word_w
                 else:
-                    if cur:
-                        lines.append(cur)
-                    cur = word
+                    lines.append(cur)
+                    cur, cur_w = word, word_w
             if cur:
                 lines.append(cur)
         return lines or [""]
@@ -404,7 +450,7 @@ class SocialScreen(BaseScreen):
 
     def _draw_portrait_frame(self, rect: pygame.Rect,
                              surf: Optional[pygame.Surface], label: str) -> None:
-        pygame.draw.rect(self.screen, DARK_GRAY, rect, border_radius=8)
+        self.screen.blit(_rounded(rect.w, rect.h, DARK_GRAY, 0, 8), rect.topleft)
         if surf:
             pad   = 4
             inner = rect.inflate(-pad * 2, -pad * 2)
@@ -415,8 +461,11 @@ class SocialScreen(BaseScreen):
             pygame.draw.circle(self.screen, LIGHT_GRAY, (cx, cy - r // 2), r // 2, 2)
             pygame.draw.arc(self.screen, LIGHT_GRAY,
                             pygame.Rect(cx - r, cy, r * 2, r), 0, 3.14159, 2)
-        pygame.draw.rect(self.screen, GOLD, rect, width=2, border_radius=8)
-        name_surf = self.small_font.render(label, True, GOLD)
+        self.screen.blit(_rounded(rect.w, rect.h, GOLD, 2, 8), rect.topleft)
+        name_surf = self._name_surf_cache.get(label)
+        if name_surf is None:
+            name_surf = self.small_font.render(label, True, GOLD)
+            self._name_surf_cache[label] = name_surf
         self.screen.blit(name_surf, (
             rect.centerx - name_surf.get_width() // 2,
             rect.bottom + _sc(4, self._scale)
@@ -537,23 +586,26 @@ class SocialScreen(BaseScreen):
         self._draw_portrait_frame(self._player_portrait_rect, player_img, player_name)
 
         # Chat box
-        pygame.draw.rect(self.screen, MODAL_BG, self._chat_rect, border_radius=8)
-        pygame.draw.rect(self.screen, GOLD,     self._chat_rect, width=2, border_radius=8)
+        chat_w, chat_h = self._chat_rect.size
+        self.screen.blit(_rounded(chat_w, chat_h, MODAL_BG, 0, 8), self._chat_rect.topleft)
+        self.screen.blit(_rounded(chat_w, chat_h, GOLD,     2, 8), self._chat_rect.topleft)
 
         pad   = self._chat_pad
         max_w = self._chat_rect.w - 2 * pad - SB_W - SB_PAD - 4
         lines = self._all_wrapped_lines(max_w)
 
-        clip_save = self.screen.get_clip()
-        self.screen.set_clip(self._chat_rect)
-        y = self._chat_rect.y + pad - self._chat_scroll
+        # Loop invariants hoisted: colour comes from the role tagged on insert,
+        # so the per-line work is one dict lookup + render_to.
+        role_color = _ROLE_COLORS.get
+        render_to  = self.chat_font.render_to
+        canvas     = self._chat_canvas
+        line_h     = self._line_h
+        height     = self._chat_rect.height
+        y = pad - self._chat_scroll
         for text, role in lines:
-            if self._chat_rect.y < y + self._line_h and y < self._chat_rect.bottom:
-                color = _ROLE_COLORS.get(role, LIGHT_GRAY)
-                surf  = self.small_font.render(text, True, color)
-                self.screen.blit(surf, (self._chat_rect.x + pad, y))
-            y += self._line_h
-        self.screen.set_clip(clip_save)
+            if 0 < y + line_h and y < height:
+                render_to(canvas, (pad, y), text, role_color(role, LIGHT_GRAY))
+            y += line_h
 
         # Scrollbar
         if self._chat_max_scroll() > 0:
@@ -563,9 +615,10 @@ class SocialScreen(BaseScreen):
                 pygame.draw.rect(self.screen, GOLD,      thumb, border_radius=4)
 
         # Input field
-        pygame.draw.rect(self.screen, INPUT_BG, self._input_rect, border_radius=6)
+        in_w, in_h = self._input_rect.size
         border_col = GOLD if self._input_active else LIGHT_GRAY
-        pygame.draw.rect(self.screen, border_col, self._input_rect, width=2, border_radius=6)
+        self.screen.blit(_rounded(in_w, in_h, INPUT_BG,   0, 6), self._input_rect.topleft)
+        self.screen.blit(_rounded(in_w, in_h, border_col, 2, 6), self._input_rect.topleft)
         input_text = self._input_buffer or "Сказать что-нибудь..."
         input_col  = WHITE if self._input_buffer else LIGHT_GRAY
         input_surf = self.font.render(input_text[:80], True, input_col)
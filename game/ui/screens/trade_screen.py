@@ -18,7 +18,8 @@ from __future__ import annotations
 
 import os
 import pygame
-from typing import List, Optional, Dict, Tuple, Set, TYPE_CHECKING
+from operator import attrgetter
+from typing import List, Optional, Dict, Sequence, Tuple, Set, TYPE_CHECKING
 
 from .base_screen import BaseScreen
 from ..colors import *
@@ -37,6 +38,35 @@ if TYPE_CHECKING:
 
 SB_W = 10
 SB_PAD = 3
+TEXT_CACHE_MAX = 512
+
+# Row palette: zebra stripes per list kind, and the highlight for offered items
+_INV_STRIPES    = (DARK_GRAY, MODAL_BG)
+_BARTER_STRIPES = (DARK_GRAY, (35, 35, 35))
+_OFFERED_BG     = (55, 44, 8)
+
+# Drop-zone highlight while dragging: (border rgb, tint rgba)
+_DROP_VALID   = ((60, 200, 80), (60, 200, 80, 55))
+_DROP_INVALID = ((200, 60, 60), (200, 60, 60, 55))
+
+# pygame-ce's fblits skips building the per-blit result list; plain pygame has blits only
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+# (name, index, price) of an item in one call; used when building list rows
+_item_label_fields = attrgetter("name", "index", "price")
+
+# Screen regions repainted independently by draw(); list panels use PANEL_* keys
+REGION_TOP    = "top"
+REGION_DESC   = "desc"
+REGION_BOTTOM = "bottom"
+# Single-button regions inside REGION_BOTTOM, repainted on hover changes
+REGION_BALANCE_BTN = "balance_btn"
+REGION_BARTER_BTN  = "barter_btn"
+REGION_LEAVE_BTN   = "leave_btn"
+# Events that carry a cursor position; handle_event records it for update()/wheel
+_POINTER_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+# Above this many stale regions a full repaint + flip is cheaper than update(rects)
+MAX_DIRTY_REGIONS = 3
 
 SLOTS = [
     ("head",       "inv_head",       []),
@@ -56,6 +86,17 @@ def _sc(v: float, s: float) -> int:
     return max(1, int(v * s))
 
 
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def _font(size: int) -> pygame.font.Font:
+    """Default font at *size*, shared across layouts so resizes don't reopen it."""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
+
 def _slot_label(loc_key: str) -> str:
     try:
         return loc[loc_key]
@@ -76,7 +117,31 @@ class TradeScreen(BaseScreen):
     def __init__(self, screen: pygame.Surface):
         super().__init__(screen)
         self._trade = TradeState()
+        # (resolved path, size) → scaled portrait; see _load_portrait()
         self._portrait_cache: dict = {}
+        # raw icon path → existing file path, or None if it cannot be found
+        self._portrait_path_resolved: Dict[str, Optional[str]] = {}
+        # resolved path → unscaled convert_alpha() image, or None if loading failed
+        self._portrait_base: Dict[str, Optional[pygame.Surface]] = {}
+        # (text, color, id(font)) → rendered Surface; see _render_cached()
+        self._text_cache: Dict[Tuple[str, tuple, int], pygame.Surface] = {}
+        # PANEL_* → (list version, [row tuple or None, ...]); see _list_rows()
+        self._row_cache: Dict[str, Tuple[tuple, list]] = {}
+        # (id(item), max_len) → truncated display name; see _item_label()
+        self._label_cache: Dict[Tuple[int, int], str] = {}
+        # (id(item), max_w) → wrapped description lines; see _desc_lines()
+        self._wrap_cache: Dict[Tuple[int, int], List[str]] = {}
+        # ((id(item), width), all wrapped lines pre-blitted); see _desc_sheet_for()
+        self._desc_sheet: Optional[Tuple[Tuple[int, int], pygame.Surface]] = None
+        # PANEL_* → pre-rendered frame and zebra stripes; rebuilt by _build_layout()
+        self._panel_bg_surfs: Dict[str, pygame.Surface] = {}
+        self._stripe_surfs:   Dict[str, pygame.Surface] = {}
+        # Session-static chrome (portraits, panel frames, titles); see _build_background()
+        self._bg_surface: Optional[pygame.Surface] = None
+        # Dim laid over the barter button while the offer is unbalanced
+        self._barter_dim: Optional[pygame.Surface] = None
+        # drag source → (all five drop-zone tints + borders in one surface, topleft)
+        self._drop_overlays: Dict[str, Tuple[pygame.Surface, Tuple[int, int]]] = {}
 
         # ---- Scroll ----
         self._player_inv_scroll:    int = 0
@@ -97,10 +162,35 @@ class TradeScreen(BaseScreen):
         self._drag_pos:          Tuple[int, int] = (0, 0)
         self._drag_start_pos:    Tuple[int, int] = (0, 0)
         self._pending_drag_item: Optional[GameEquipment] = None
+        # Last cursor position seen in an event; saves an SDL query per frame
+        self._mouse_pos:         Tuple[int, int] = (0, 0)
+        # Cursor position the button hover states were last computed for
+        self._hover_pos:         Optional[Tuple[int, int]] = None
         self._drag_threshold:    int = 6
+        self._drag_threshold_sq: int = self._drag_threshold * self._drag_threshold
+        # Screen copy with drop zones but no ghost; valid while _drag_backdrop_ok
+        self._drag_backdrop:     Optional[pygame.Surface] = None
+        self._drag_backdrop_ok:  bool = False
+        self._ghost_rect:        Optional[pygame.Rect] = None
+        self._ghost_pos:         Optional[Tuple[int, int]] = None
+        # Backing + label composite for the dragged item, keyed by id(item)
+        self._ghost_surf:        Optional[pygame.Surface] = None
+        self._ghost_key:         Optional[int] = None
+
+        # ---- Participant names, resolved once per (player, npc) pair ----
+        self._names_key: Optional[Tuple[int, int]] = None
+        self._names:     Tuple[str, str] = ("Игрок", "???")
+
+        # ---- Dirty regions ----
+        # draw() repaints only these region keys, or everything when _full_redraw is set
+        self._dirty:       Set[str] = set()
+        self._full_redraw: bool     = True
 
         # ---- Layout rects (built in _build_layout) ----
         self._slot_rects: Dict[str, pygame.Rect] = {}
+        # y of the first slot and slot pitch, for _slot_at's row arithmetic
+        self._slot_top:   int = 0
+        self._slot_row_h: int = 1
 
         self._equip_panel         = pygame.Rect(0, 0, 0, 0)
         self._player_inv_panel    = pygame.Rect(0, 0, 0, 0)
@@ -141,9 +231,17 @@ class TradeScreen(BaseScreen):
         """Set the destination when the player clicks 'Уйти' (e.g. 'social' or 'main')."""
         self._return_to = screen_name
 
+    def invalidate(self) -> None:
+        self._full_redraw = True
+
     def set_npc(self, npc_id: ID) -> None:
         """Initialise screen for a given NPC and reset all state."""
         self._trade.reset(npc_id)
+        self._row_cache.clear()
+        self._label_cache.clear()
+        self._wrap_cache.clear()
+        self._desc_sheet = None
+        self._names_key = None
         self._player_inv_scroll    = 0
         self._npc_inv_scroll       = 0
         self._player_barter_scroll = 0
@@ -152,6 +250,12 @@ class TradeScreen(BaseScreen):
         self._hovered_item    = None
         self._desc_scroll     = 0
         self._desc_max_scroll = 0
+        # The cursor may already be over a button when the screen opens
+        self._mouse_pos       = pygame.mouse.get_pos()
+        self._hover_pos       = None
+        # Build the portraits and chrome now rather than on the first frame
+        self._build_background()
+        self._full_redraw     = True
 
     # ------------------------------------------------------------------
     # LAYOUT
@@ -161,9 +265,13 @@ class TradeScreen(BaseScreen):
         s = self._scale
         w, h = self._w, self._h
 
-        self.font       = pygame.font.Font(None, _sc(24, s))
-        self.small_font = pygame.font.Font(None, _sc(20, s))
-        self.tiny_font  = pygame.font.Font(None, _sc(17, s))
+        self.font       = _font(_sc(24, s))
+        self.small_font = _font(_sc(20, s))
+        self.tiny_font  = _font(_sc(17, s))
+        self._text_cache.clear()
+        self._row_cache.clear()
+        self._wrap_cache.clear()
+        self._desc_sheet = None
 
         m   = _sc(10, s)
         gap = _sc(8, s)
@@ -212,6 +320,16 @@ class TradeScreen(BaseScreen):
         title_h  = _sc(18, s)
         list_pad = 4
 
+        # Scale-derived sizes used by the per-frame / per-event paths
+        self._line_h      = _sc(24, s)
+        self._wheel_step  = self._line_h * 3
+        self._desc_line_h = _sc(17, s)
+        # description panel: gap under the name, gap under the cost, bottom pad
+        self._desc_gaps   = (_sc(4, s), _sc(3, s), _sc(4, s))
+        # empty description panel: first hint line's offset above centre, line pitch
+        self._desc_hint_dy   = _sc(10, s)
+        self._desc_hint_step = _sc(18, s)
+
         self._equip_panel = pygame.Rect(eq_x, content_top, eq_w, content_h)
 
         self._player_inv_panel = pygame.Rect(pl_inv_x, content_top, inv_w, content_h)
@@ -271,9 +389,114 @@ class TradeScreen(BaseScreen):
         self._leave_btn = Button(
             act_x + act_barter_w + act_gap, act_y, act_leave_w, btn_h, "Уйти", self.small_font
         )
+        self._barter_dim = pygame.Surface(self._barter_btn.rect.size, pygame.SRCALPHA)
+        self._barter_dim.fill((0, 0, 0, 150))
+
+        # Hit-test tables: one Rect.collidelist call per mouse event
+        self._drop_panels = [
+            self._player_barter_panel, self._npc_barter_panel,
+            self._player_inv_panel, self._equip_panel, self._npc_inv_panel,
+        ]
+        self._drop_labels = (
+            PANEL_PLAYER_BARTER, PANEL_NPC_BARTER,
+            PANEL_PLAYER_INV, PANEL_EQUIP, PANEL_NPC_INV,
+        )
+        self._coin_input_rects = [self._player_coin_input_rect, self._npc_coin_input_rect]
+        self._list_rects = [
+            self._player_inv_rect, self._npc_inv_rect,
+            self._player_barter_rect, self._npc_barter_rect,
+        ]
+        self._list_sources = (
+            PANEL_PLAYER_INV, PANEL_NPC_INV, PANEL_PLAYER_BARTER, PANEL_NPC_BARTER,
+        )
+        self._list_scroll_attrs = (
+            "_player_inv_scroll", "_npc_inv_scroll",
+            "_player_barter_scroll", "_npc_barter_scroll",
+        )
+        # drag source → ids of the panels it may be dropped on (drop-zone highlight)
+        player_offer = frozenset({id(self._player_barter_panel)})
+        self._valid_drop_ids: Dict[str, frozenset] = {
+            PANEL_PLAYER_INV:    player_offer,
+            PANEL_PLAYER_EQUIP:  player_offer,
+            PANEL_PLAYER_BARTER: frozenset({id(self._player_inv_panel), id(self._equip_panel)}),
+            PANEL_NPC_INV:       frozenset({id(self._npc_barter_panel)}),
+            PANEL_NPC_BARTER:    frozenset({id(self._npc_inv_panel)}),
+        }
+        self._drop_overlays.clear()
+
+        # Static list panel chrome
+        self._bake_list_panel(PANEL_PLAYER_INV, self._player_inv_panel,
+                              self._player_inv_rect, MODAL_BG, _INV_STRIPES)
+        self._bake_list_panel(PANEL_NPC_INV, self._npc_inv_panel,
+                              self._npc_inv_rect, MODAL_BG, _INV_STRIPES)
+        self._bake_list_panel(PANEL_PLAYER_BARTER, self._player_barter_panel,
+                              self._player_barter_rect, (22, 20, 10), _BARTER_STRIPES)
+        self._bake_list_panel(PANEL_NPC_BARTER, self._npc_barter_panel,
+                              self._npc_barter_rect, (22, 20, 10), _BARTER_STRIPES)
+
+        # Repaint regions, in full-draw order
+        self._region_rects: Dict[str, pygame.Rect] = {
+            REGION_TOP:          pygame.Rect(0, 0, w, content_top),
+            PANEL_EQUIP:         self._equip_panel,
+            PANEL_PLAYER_INV:    self._player_inv_panel,
+            PANEL_NPC_INV:       self._npc_inv_panel,
+            PANEL_PLAYER_BARTER: self._player_barter_panel,
+            PANEL_NPC_BARTER:    self._npc_barter_panel,
+            REGION_DESC:         self._desc_panel,
+            REGION_BOTTOM:       pygame.Rect(0, content_bottom, w, h - content_bottom),
+        }
+        self._region_painters = {
+            REGION_TOP:          self._draw_top_strip,
+            PANEL_EQUIP:         self._draw_equip_panel,
+            PANEL_PLAYER_INV:    self._draw_player_inv,
+            PANEL_NPC_INV:       self._draw_npc_inv,
+            PANEL_PLAYER_BARTER: self._draw_player_barter,
+            PANEL_NPC_BARTER:    self._draw_npc_barter,
+            REGION_DESC:         self._draw_desc_panel,
+            REGION_BOTTOM:       self._draw_bottom_strip,
+        }
+        # A full repaint runs every painter above; the button regions below
+        # overlap REGION_BOTTOM and are only ever repainted on their own
+        self._full_painters = tuple(self._region_painters.values())
+        self._hover_buttons = (
+            (REGION_BALANCE_BTN, self._balance_btn, self._draw_balance_btn),
+            (REGION_BARTER_BTN,  self._barter_btn,  self._draw_barter_btn),
+            (REGION_LEAVE_BTN,   self._leave_btn,   self._draw_leave_btn),
+        )
+        for key, btn, paint in self._hover_buttons:
+            self._region_rects[key]    = btn.rect
+            self._region_painters[key] = paint
+        self._hover_pos = None  # fresh buttons start unhovered
+        self._bg_surface  = None
+        self._full_redraw = True
 
         self._layout_equip_slots()
 
+    def _bake_list_panel(self, key: str, panel: pygame.Rect, list_rect: pygame.Rect,
+                         fill: tuple, stripes: Tuple[tuple, tuple]) -> None:
+        """Pre-render a list panel's frame and a tall zebra-stripe strip."""
+        bg = pygame.Surface(panel.size, pygame.SRCALPHA)
+        pygame.draw.rect(bg, fill, bg.get_rect(), border_radius=6)
+        pygame.draw.rect(bg, GOLD, bg.get_rect(), width=1, border_radius=6)
+        self._panel_bg_surfs[key] = bg
+
+        # Two extra rows so any scroll offset modulo the stripe period is covered
+        line_h = self._line_h
+        rows   = list_rect.h // line_h + 3
+        strip  = pygame.Surface((list_rect.w, rows * line_h))
+        for i in range(rows):
+            strip.fill(stripes[i & 1], (0, i * line_h, list_rect.w, line_h))
+        self._stripe_surfs[key] = strip
+
+    def _blit_stripes(self, key: str, list_rect: pygame.Rect,
+                      count: int, scroll: int, line_h: int) -> None:
+        """Blit the zebra strip behind the *count* rows of a list, cut to the rows shown."""
+        h = min(list_rect.h, count * line_h - scroll)
+        if h <= 0:
+            return
+        self.screen.blit(self._stripe_surfs[key], list_rect.topleft,
+                         (0, scroll % (2 * line_h), list_rect.w, h))
+
     def _layout_equip_slots(self) -> None:
         r  = self._equip_panel
         s  = self._scale
@@ -285,6 +508,23 @@ class TradeScreen(BaseScreen):
         y = r.y + pad + title_h
         for i, (key, _, _) in enumerate(SLOTS):
             self._slot_rects[key] = pygame.Rect(r.x + pad, y + i * row_h, slot_w, slot_h)
+        self._slot_top   = y
+        self._slot_row_h = row_h
+
+        # Empty-slot captions; only the background build blits them
+        self._slot_label_surfs: Dict[str, pygame.Surface] = {
+            key: self.tiny_font.render(_slot_label(loc_key)[:12], True, (50, 50, 50)).convert_alpha()
+            for key, loc_key, _ in SLOTS
+        }
+
+        # Occupied-slot frame, plain and offered; all slots share one size
+        self._slot_chrome: Dict[bool, pygame.Surface] = {}
+        for offered, (bg, border) in ((False, (DARK_GRAY, GOLD)),
+                                      (True,  (_OFFERED_BG, BRIGHT_GOLD))):
+            surf = pygame.Surface((slot_w, slot_h), pygame.SRCALPHA)
+            pygame.draw.rect(surf, bg,     surf.get_rect(), border_radius=3)
+            pygame.draw.rect(surf, border, surf.get_rect(), width=1, border_radius=3)
+            self._slot_chrome[offered] = surf
 
     # ------------------------------------------------------------------
     # HIT-TEST HELPERS  (coordinate → panel label)
@@ -292,59 +532,44 @@ class TradeScreen(BaseScreen):
 
     def _panel_at(self, pos: Tuple[int, int]) -> str:
         """Return the PANEL_* label for the panel under *pos*, or ''."""
-        if self._player_barter_panel.collidepoint(pos):
-            return PANEL_PLAYER_BARTER
-        if self._npc_barter_panel.collidepoint(pos):
-            return PANEL_NPC_BARTER
-        if self._player_inv_panel.collidepoint(pos):
-            return PANEL_PLAYER_INV
-        if self._equip_panel.collidepoint(pos):
-            return PANEL_EQUIP
-        if self._npc_inv_panel.collidepoint(pos):
-            return PANEL_NPC_INV
-        return ""
+        idx = pygame.Rect(pos, (1, 1)).collidelist(self._drop_panels)
+        return self._drop_labels[idx] if idx != -1 else ""
+
+    def _list_state(self, source: str) -> Tuple[list, int]:
+        """Return (items, scroll) for the list panel labelled *source*."""
+        trade = self._trade
+        if source == PANEL_PLAYER_INV:
+            return trade.player_inv_items(), self._player_inv_scroll
+        if source == PANEL_NPC_INV:
+            return trade.npc_inv_items(), self._npc_inv_scroll
+        if source == PANEL_PLAYER_BARTER:
+            return trade.player_barter, self._player_barter_scroll
+        return trade.npc_barter, self._npc_barter_scroll
 
     def _item_at_list(self, pos: Tuple[int, int], rect: pygame.Rect,
                       items: list, scroll: int) -> Optional[GameEquipment]:
         if not rect.collidepoint(pos):
             return None
-        line_h = _sc(24, self._scale)
-        for i, it in enumerate(items):
-            ry = rect.y + i * line_h - scroll
-            if ry <= pos[1] < ry + line_h:
-                return it
-        return None
+        i = (pos[1] - rect.y + scroll) // self._line_h
+        return items[i] if 0 <= i < len(items) else None
+
+    def _slot_at(self, pos: Tuple[int, int]) -> str:
+        """Slot key under *pos*, or ''; slots are evenly spaced rows."""
+        i = (pos[1] - self._slot_top) // self._slot_row_h
+        if 0 <= i < len(SLOTS):
+            key = SLOTS[i][0]
+            if self._slot_rects[key].collidepoint(pos):
+                return key
+        return ""
 
     def _item_under_mouse(self, pos: Tuple[int, int]) -> Optional[GameEquipment]:
         """Return the item (if any) under the mouse across all panels."""
-        s      = self._scale
-        line_h = _sc(24, s)
-
-        def _at(rect: pygame.Rect, items: list, scroll: int) -> Optional[GameEquipment]:
-            if not rect.collidepoint(pos):
-                return None
-            for i, it in enumerate(items):
-                ry = rect.y + i * line_h - scroll
-                if ry <= pos[1] < ry + line_h:
-                    return it
-            return None
-
-        t = _at(self._player_inv_rect, self._trade.player_inv_items(), self._player_inv_scroll)
-        if t:
-            return t
-        t = _at(self._npc_inv_rect, self._trade.npc_inv_items(), self._npc_inv_scroll)
-        if t:
-            return t
-        t = _at(self._player_barter_rect, self._trade.player_barter, self._player_barter_scroll)
-        if t:
-            return t
-        t = _at(self._npc_barter_rect, self._trade.npc_barter, self._npc_barter_scroll)
-        if t:
-            return t
-        for slot_key, rect in self._slot_rects.items():
-            if rect.collidepoint(pos):
-                return self._trade.item_in_slot(slot_key)
-        return None
+        idx = pygame.Rect(pos, (1, 1)).collidelist(self._list_rects)
+        if idx != -1:
+            items, scroll = self._list_state(self._list_sources[idx])
+            return self._item_at_list(pos, self._list_rects[idx], items, scroll)
+        slot_key = self._slot_at(pos)
+        return self._trade.item_in_slot(slot_key) if slot_key else None
 
     # ------------------------------------------------------------------
     # DESCRIPTION HELPERS
@@ -354,6 +579,7 @@ class TradeScreen(BaseScreen):
         if item is not self._selected_item:
             self._selected_item = item
             self._desc_scroll   = 0
+            self._dirty.add(REGION_DESC)
 
     def _wrap_desc(self, raw_lines: list, max_w: int) -> List[str]:
         out: List[str] = []
@@ -375,11 +601,43 @@ class TradeScreen(BaseScreen):
                 out.append(cur)
         return out or ["—"]
 
+    def _desc_lines(self, item: GameEquipment, max_w: int) -> List[str]:
+        """_wrap_desc() of the item's description, wrapped once per item and width."""
+        key   = (id(item), max_w)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = self._wrap_cache[key] = self._wrap_desc(item.desc or ["—"], max_w)
+        return lines
+
+    def _desc_sheet_for(self, item: GameEquipment, wrapped: List[str],
+                        max_w: int) -> pygame.Surface:
+        """All of *item*'s wrapped lines on one transparent surface; scrolling blits a slice."""
+        key = (id(item), max_w)
+        if self._desc_sheet is None or self._desc_sheet[0] != key:
+            font   = self.tiny_font
+            line_h = self._desc_line_h
+            lines  = [font.render(line, True, LIGHT_GRAY) for line in wrapped]
+            # a long unbreakable word may run past max_w; glyphs may hang below line_h
+            w = max([max_w] + [ls.get_width() for ls in lines])
+            h = max([1] + [i * line_h + ls.get_height() for i, ls in enumerate(lines)])
+            sheet = pygame.Surface((w, h), pygame.SRCALPHA)
+            sheet.blits([(ls, (0, i * line_h)) for i, ls in enumerate(lines)], False)
+            self._desc_sheet = (key, sheet)
+        return self._desc_sheet[1]
+
     # ------------------------------------------------------------------
     # DRAG-AND-DROP HELPERS
     # ------------------------------------------------------------------
 
     def _cancel_drag(self) -> None:
+        if self._drag_item is not None:
+            # the drop-zone overlay covers every panel
+            self._full_redraw = True
+        self._drag_backdrop_ok  = False
+        self._ghost_rect        = None
+        self._ghost_pos         = None
+        self._ghost_surf        = None
+        self._ghost_key         = None
         self._drag_item         = None
         self._drag_source       = ""
         self._pending_drag_item = None
@@ -399,6 +657,8 @@ class TradeScreen(BaseScreen):
 
     def handle_event(self, event: pygame.event.Event):
         trade = self._trade
+        if event.type in _POINTER_EVENTS:
+            self._mouse_pos = event.pos
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
@@ -408,32 +668,22 @@ class TradeScreen(BaseScreen):
                 return "social"
 
             # Coin field keyboard input
-            if trade.coin_active == "player":
-                if event.key == pygame.K_BACKSPACE:
-                    trade.coin_buf_player = trade.coin_buf_player[:-1]
-                elif event.unicode.isdigit() and len(trade.coin_buf_player) < 9:
-                    trade.coin_buf_player += event.unicode
-                trade.player_coins_offer = int(trade.coin_buf_player) if trade.coin_buf_player else 0
-                return None
-            if trade.coin_active == "npc":
-                if event.key == pygame.K_BACKSPACE:
-                    trade.coin_buf_npc = trade.coin_buf_npc[:-1]
-                elif event.unicode.isdigit() and len(trade.coin_buf_npc) < 9:
-                    trade.coin_buf_npc += event.unicode
-                trade.npc_coins_offer = int(trade.coin_buf_npc) if trade.coin_buf_npc else 0
-                return None
+            if trade.coin_active:
+                ch = "\b" if event.key == pygame.K_BACKSPACE else event.unicode
+                if trade.coin_input(ch):
+                    self._dirty.update((REGION_TOP, REGION_BOTTOM))
             return None
 
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             pos = event.pos
-            self._layout_equip_slots()
+            pos_rect = pygame.Rect(pos, (1, 1))
+            # coin focus may change on any click
+            self._dirty.add(REGION_BOTTOM)
 
             # Coin input focus
-            if self._player_coin_input_rect.collidepoint(pos):
-                trade.coin_active = "player"
-                return None
-            if self._npc_coin_input_rect.collidepoint(pos):
-                trade.coin_active = "npc"
+            idx = pos_rect.collidelist(self._coin_input_rects)
+            if idx != -1:
+                trade.coin_active = ("player", "npc")[idx]
                 return None
             trade.coin_active = ""
 
@@ -442,83 +692,61 @@ class TradeScreen(BaseScreen):
                 return self._return_to
             if self._balance_btn and self._balance_btn.is_clicked(pos):
                 trade.balance()
+                self._dirty.add(REGION_TOP)
                 return None
             if self._barter_btn and self._barter_btn.is_clicked(pos) and trade.is_balanced():
                 trade.execute_barter()
+                self._full_redraw = True
                 return None
 
-            # ── Start drag from player inventory ──────────────────────
-            pl_items = trade.player_inv_items()
-            it = self._item_at_list(pos, self._player_inv_rect, pl_items, self._player_inv_scroll)
-            if it:
-                self._pin_item(it)
-                self._pending_drag_item = it
-                self._drag_source       = PANEL_PLAYER_INV
-                self._drag_start_pos    = pos
-                self._drag_item         = None
-                return None
-
-            # ── Start drag from NPC inventory ─────────────────────────
-            npc_items = trade.npc_inv_items()
-            it = self._item_at_list(pos, self._npc_inv_rect, npc_items, self._npc_inv_scroll)
-            if it:
-                self._pin_item(it)
-                self._pending_drag_item = it
-                self._drag_source       = PANEL_NPC_INV
-                self._drag_start_pos    = pos
-                self._drag_item         = None
-                return None
-
-            # ── Start drag from player barter list ────────────────────
-            it = self._item_at_list(pos, self._player_barter_rect,
-                                    trade.player_barter, self._player_barter_scroll)
-            if it:
-                self._pin_item(it)
-                self._pending_drag_item = it
-                self._drag_source       = PANEL_PLAYER_BARTER
-                self._drag_start_pos    = pos
-                self._drag_item         = None
-                return None
-
-            # ── Start drag from NPC barter list ───────────────────────
-            it = self._item_at_list(pos, self._npc_barter_rect,
-                                    trade.npc_barter, self._npc_barter_scroll)
-            if it:
-                self._pin_item(it)
-                self._pending_drag_item = it
-                self._drag_source       = PANEL_NPC_BARTER
-                self._drag_start_pos    = pos
-                self._drag_item         = None
-                return None
+            # ── Start drag from an inventory or barter list ───────────
+            idx = pos_rect.collidelist(self._list_rects)
+            if idx != -1:
+                source = self._list_sources[idx]
+                items, scroll = self._list_state(source)
+                it = self._item_at_list(pos, self._list_rects[idx], items, scroll)
+                if it:
+                    self._pin_item(it)
+                    self._pending_drag_item = it
+                    self._drag_source       = source
+                    self._drag_start_pos    = pos
+                    self._drag_item         = None
+                    return None
 
             # ── Start drag from equipment slot ────────────────────────
-            for slot_key, rect in self._slot_rects.items():
-                if rect.collidepoint(pos):
-                    item = self._trade.item_in_slot(slot_key)
-                    if item:
-                        self._pin_item(item)
-                        self._pending_drag_item = item
-                        self._drag_source       = PANEL_PLAYER_EQUIP
-                        self._drag_start_pos    = pos
-                        self._drag_item         = None
-                    return None
+            slot_key = self._slot_at(pos)
+            if slot_key:
+                item = self._trade.item_in_slot(slot_key)
+                if item:
+                    self._pin_item(item)
+                    self._pending_drag_item = item
+                    self._drag_source       = PANEL_PLAYER_EQUIP
+                    self._drag_start_pos    = pos
+                    self._drag_item         = None
+                return None
 
             return None
 
         if event.type == pygame.MOUSEMOTION:
             if event.buttons[0] and self._drag_start_pos != (0, 0) and self._drag_item is None:
-                dx = event.pos[0] - self._drag_start_pos[0]
-                dy = event.pos[1] - self._drag_start_pos[1]
-                if (dx * dx + dy * dy) >= self._drag_threshold ** 2:
+                dx = abs(event.pos[0] - self._drag_start_pos[0])
+                dy = abs(event.pos[1] - self._drag_start_pos[1])
+                # |dx| + |dy| >= distance, so a sum below the threshold already
+                # proves the pointer is inside it: cheap reject before the squared test
+                if (dx + dy >= self._drag_threshold
+                        and dx * dx + dy * dy >= self._drag_threshold_sq):
                     if self._pending_drag_item is not None:
                         self._drag_item = self._pending_drag_item
             if self._drag_item:
+                # hover is irrelevant under the drag ghost; resumes after the drop
                 self._drag_pos = event.pos
+                return None
             new_hover = self._item_under_mouse(event.pos)
             if new_hover is not self._hovered_item:
                 self._hovered_item = new_hover
                 if self._selected_item is None:
                     self._desc_scroll = 0
+                    self._dirty.add(REGION_DESC)
             return None
 
         if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -528,35 +756,25 @@ class TradeScreen(BaseScreen):
             return None
 
         if event.type == pygame.MOUSEWHEEL:
-            mpos   = pygame.mouse.get_pos()
-            s      = self._scale
-            line_h = _sc(24, s)
-            step   = line_h * 3
-
-            def _clamp(cur: int, count: int, rect_h: int, dy: int) -> int:
-                max_s = max(0, count * line_h - rect_h)
-                return max(0, min(max_s, cur + (-step if dy > 0 else step)))
-
-            if self._player_inv_rect.collidepoint(mpos):
-                self._player_inv_scroll = _clamp(
-                    self._player_inv_scroll, len(trade.player_inv_items()),
-                    self._player_inv_rect.height, event.y)
-            elif self._npc_inv_rect.collidepoint(mpos):
-                self._npc_inv_scroll = _clamp(
-                    self._npc_inv_scroll, len(trade.npc_inv_items()),
-                    self._npc_inv_rect.height, event.y)
-            elif self._player_barter_rect.collidepoint(mpos):
-                self._player_barter_scroll = _clamp(
-                    self._player_barter_scroll, len(trade.player_barter),
-                    self._player_barter_rect.height, event.y)
-            elif self._npc_barter_rect.collidepoint(mpos):
-                self._npc_barter_scroll = _clamp(
-                    self._npc_barter_scroll, len(trade.npc_barter),
-                    self._npc_barter_rect.height, event.y)
+            mpos   = self._mouse_pos
+            line_h = self._line_h
+            step   = self._wheel_step
+
+            idx = pygame.Rect(mpos, (1, 1)).collidelist(self._list_rects)
+            if idx != -1:
+                items, cur = self._list_state(self._list_sources[idx])
+                max_s = max(0, len(items) * line_h - self._list_rects[idx].height)
+                new   = max(0, min(max_s, cur + (-step if event.y > 0 else step)))
+                # wheeling past either end leaves the list (and the screen) as is
+                if new != cur:
+                    setattr(self, self._list_scroll_attrs[idx], new)
+                    self._dirty.add(self._list_sources[idx])
             elif self._desc_panel.collidepoint(mpos) and self._desc_max_scroll > 0:
                 delta = -step if event.y > 0 else step
-                self._desc_scroll = max(0, min(self._desc_max_scroll,
-                                               self._desc_scroll + delta))
+                new   = max(0, min(self._desc_max_scroll, self._desc_scroll + delta))
+                if new != self._desc_scroll:
+                    self._desc_scroll = new
+                    self._dirty.add(REGION_DESC)
             return None
 
         return None
@@ -566,129 +784,260 @@ class TradeScreen(BaseScreen):
     # ------------------------------------------------------------------
 
     def update(self):
-        pos = pygame.mouse.get_pos()
-        if self._balance_btn:
-            self._balance_btn.update(pos)
-        if self._barter_btn:
-            self._barter_btn.update(pos)
-        if self._leave_btn:
-            self._leave_btn.update(pos)
+        pos = self._mouse_pos
+        if pos == self._hover_pos:
+            return
+        self._hover_pos = pos
+        for key, btn, _ in self._hover_buttons:
+            was_hovered = btn.hovered
+            btn.update(pos)
+            if btn.hovered != was_hovered:
+                self._dirty.add(key)
 
     # ------------------------------------------------------------------
     # DRAW HELPERS
     # ------------------------------------------------------------------
 
+    def _render_cached(self, font: pygame.font.Font, text: str,
+                       color: tuple) -> pygame.Surface:
+        """
+        font.render() memoized per (text, color, font).  Hits move to the back
+        of the dict, so eviction drops the least recently used surface.
+        """
+        cache = self._text_cache
+        key   = (text, color, id(font))
+        surf  = cache.pop(key, None)
+        if surf is None:
+            if len(cache) >= TEXT_CACHE_MAX:
+                del cache[next(iter(cache))]
+            # display pixel format: later blits skip the per-call conversion
+            surf = font.render(text, True, color).convert_alpha()
+        cache[key] = surf
+        return surf
+
+    def _resolve_portrait_path(self, path: str) -> Optional[str]:
+        if path in self._portrait_path_resolved:
+            return self._portrait_path_resolved[path]
+        resolved: Optional[str] = path
+        if not os.path.isfile(path):
+            alt = os.path.normpath(
+                os.path.join(os.path.dirname(__file__), "..", "..", "..", path))
+            resolved = alt if os.path.isfile(alt) else None
+        self._portrait_path_resolved[path] = resolved
+        return resolved
+
     def _load_portrait(self, path: str, size: Tuple[int, int]) -> Optional[pygame.Surface]:
-        key = (path, size)
+        if not path:
+            return None
+        resolved = self._resolve_portrait_path(path)
+        if resolved is None:
+            return None
+        key = (resolved, size)
         if key in self._portrait_cache:
             return self._portrait_cache[key]
-        if not path or not os.path.exists(path):
-            alt = os.path.normpath(
-                os.path.join(os.path.dirname(__file__), "..", "..", "..", path))
-            if not os.path.exists(alt):
-                self._portrait_cache[key] = None
-                return None
-            path = alt
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.smoothscale(img, size)
-            self._portrait_cache[key] = img
-        except Exception:
-            self._portrait_cache[key] = None
-        return self._portrait_cache[key]
-
-    def _draw_portrait(self, rect: pygame.Rect, img: Optional[pygame.Surface]) -> None:
-        pygame.draw.rect(self.screen, DARK_GRAY, rect, border_radius=6)
+        if resolved not in self._portrait_base:
+            try:
+                self._portrait_base[resolved] = pygame.image.load(resolved).convert_alpha()
+            except Exception:
+                self._portrait_base[resolved] = None
+        base = self._portrait_base[resolved]
+        img  = pygame.transform.smoothscale(base, size) if base is not None else None
+        self._portrait_cache[key] = img
+        return img
+
+    def _item_label(self, item: GameEquipment, max_len: int, fallback: str = "?") -> str:
+        """`(name or index or fallback)[:max_len]`, sliced once per item and length."""
+        key   = (id(item), max_len)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = self._label_cache[key] = (item.name or item.index or fallback)[:max_len]
+        return label
+
+    def _list_rows(self, key: str, items: List[GameEquipment], name_len: int,
+                   first: int, last: int, version: Optional[tuple] = None) -> list:
+        """
+        Per-row display data for *items*, reset only when the list changes:
+        (label, name_surf, price_surf, price_w, name_dy, price_dy), with the
+        name rendered in WHITE; offered rows re-render the label in gold.
+        Rows are built lazily, so only rows[first:last] are guaranteed set.
+        Without an explicit *version* the list's length and end items stand in.
+        """
+        if version is None:
+            version = (len(items),
+                       id(items[0]) if items else 0,
+                       id(items[-1]) if items else 0)
+        cached = self._row_cache.get(key)
+        if cached is not None and cached[0] == version:
+            rows = cached[1]
+        else:
+            rows = [None] * len(items)
+            self._row_cache[key] = (version, rows)
+        if None not in rows[first:last]:
+            return rows
+        render = self._render_cached
+        font   = self.tiny_font
+        line_h = self._line_h
+        for i in range(first, last):
+            if rows[i] is not None:
+                continue
+            name, index, price = _item_label_fields(items[i])
+            label = (name or index or "?")[:name_len]
+            ns    = render(font, label, WHITE)
+            ps    = render(font, f"{price or 0}cp", LIGHT_GRAY)
+            # vertical centring offsets within a row, for the name and the price
+            rows[i] = (label, ns, ps, ps.get_width(),
+                       (line_h - ns.get_height()) // 2,
+                       (line_h - ps.get_height()) // 2)
+        return rows
+
+    def _blit_batch(self, batch: Sequence[Tuple[pygame.Surface, tuple]]) -> None:
+        """Blit a sequence of (surface, dest) pairs in one call."""
+        if _HAS_FBLITS:
+            self.screen.fblits(batch)
+        else:
+            self.screen.blits(batch, False)
+
+    def _draw_portrait(self, surf: pygame.Surface, rect: pygame.Rect,
+                       img: Optional[pygame.Surface]) -> None:
+        pygame.draw.rect(surf, DARK_GRAY, rect, border_radius=6)
         if img:
-            self.screen.blit(img, rect.topleft)
+            surf.blit(img, rect.topleft)
         else:
             cx, cy = rect.centerx, rect.centery
             r = min(rect.w, rect.h) // 3
-            pygame.draw.circle(self.screen, LIGHT_GRAY, (cx, cy - r // 3), r // 3, 2)
-            pygame.draw.arc(self.screen, LIGHT_GRAY,
+            pygame.draw.circle(surf, LIGHT_GRAY, (cx, cy - r // 3), r // 3, 2)
+            pygame.draw.arc(surf, LIGHT_GRAY,
                             pygame.Rect(cx - r // 2, cy, r, r // 2), 0, 3.14159, 2)
-        pygame.draw.rect(self.screen, GOLD, rect, width=2, border_radius=6)
-
-    def _draw_item_list(self, panel: pygame.Rect, list_rect: pygame.Rect,
-                        title: str, items: List[GameEquipment],
-                        scroll: int, in_barter: Set[int]) -> None:
-        s      = self._scale
-        line_h = _sc(24, s)
-        pygame.draw.rect(self.screen, MODAL_BG, panel, border_radius=6)
-        pygame.draw.rect(self.screen, GOLD,     panel, width=1, border_radius=6)
-        t = self.tiny_font.render(title, True, GOLD)
-        self.screen.blit(t, (panel.x + 4, panel.y + 2))
+        pygame.draw.rect(surf, GOLD, rect, width=2, border_radius=6)
+
+    def _build_background(self) -> None:
+        """
+        Composite everything that stays fixed for a barter session: portraits,
+        list and equipment panel frames with their titles.  draw() restores
+        regions from this surface before painting their dynamic content.
+        """
+        bg = pygame.Surface((self._w, self._h))
+        bg.fill(BLACK)
 
+        trade  = self._trade
+        player = trade.get_player()
+        npc    = trade.get_npc()
+        player_icon = getattr(player, "icon_image_path", "") if player else ""
+        npc_icon    = getattr(npc,    "icon_image_path", "") if npc    else ""
+        pl_sz  = (self._player_portrait_rect.w, self._player_portrait_rect.h)
+        npc_sz = (self._npc_portrait_rect.w,    self._npc_portrait_rect.h)
+        self._draw_portrait(bg, self._player_portrait_rect,
+                            self._load_portrait(player_icon, pl_sz) if player_icon else None)
+        self._draw_portrait(bg, self._npc_portrait_rect,
+                            self._load_portrait(npc_icon, npc_sz) if npc_icon else None)
+
+        pygame.draw.rect(bg, MODAL_BG, self._equip_panel, border_radius=6)
+        pygame.draw.rect(bg, GOLD,     self._equip_panel, width=1, border_radius=6)
+        t = self.tiny_font.render("Экипировка", True, GOLD)
+        bg.blit(t, (self._equip_panel.x + 4, self._equip_panel.y + 2))
+        # Empty-slot frames; _draw_equip_panel paints occupied slots over them
+        for slot_key, _, _ in SLOTS:
+            r = self._slot_rects.get(slot_key)
+            if not r:
+                continue
+            pygame.draw.rect(bg, DARK_GRAY,  r, border_radius=3)
+            pygame.draw.rect(bg, LIGHT_GRAY, r, width=1, border_radius=3)
+            ls = self._slot_label_surfs[slot_key]
+            bg.blit(ls, ls.get_rect(midleft=(r.x + 4, r.centery)))
+
+        npc_name = self._npc_name()
+        for key, panel, title, col in (
+            (PANEL_PLAYER_INV,    self._player_inv_panel,    "Инвентарь",                   GOLD),
+            (PANEL_NPC_INV,       self._npc_inv_panel,       f"Инвентарь {npc_name[:14]}",  GOLD),
+            (PANEL_PLAYER_BARTER, self._player_barter_panel, "← Ваше предложение",          BRIGHT_GOLD),
+            (PANEL_NPC_BARTER,    self._npc_barter_panel,    f"{npc_name[:12]} →",          BRIGHT_GOLD),
+        ):
+            bg.blit(self._panel_bg_surfs[key], panel.topleft)
+            t = self.tiny_font.render(title, True, col)
+            bg.blit(t, (panel.x + 4, panel.y + 2))
+
+        self._bg_surface = bg
+
+    def _draw_item_list(self, list_rect: pygame.Rect, items: List[GameEquipment],
+                        scroll: int, in_barter: Set[int], rows_key: str) -> None:
+        line_h = self._line_h
+        first  = max(0, scroll // line_h)
+        last   = min(len(items), (scroll + list_rect.height) // line_h + 2)
+        rows = self._list_rows(rows_key, items, 22, first, last)
         clip = self.screen.get_clip()
         self.screen.set_clip(list_rect)
-        for i, it in enumerate(items):
-            y = list_rect.y + i * line_h - scroll
-            if y + line_h < list_rect.y or y > list_rect.bottom:
-                continue
-            offered = id(it) in in_barter
-            bg  = (55, 44, 8) if offered else (DARK_GRAY if i % 2 == 0 else MODAL_BG)
-            col = BRIGHT_GOLD if offered else WHITE
-            pygame.draw.rect(self.screen, bg, (list_rect.x, y, list_rect.w, line_h))
-            ns = self.tiny_font.render((it.name or it.index or "?")[:22], True, col)
-            self.screen.blit(ns, (list_rect.x + 4, y + (line_h - ns.get_height()) // 2))
-            ps = self.tiny_font.render(f"{it.price or 0}cp", True, LIGHT_GRAY)
-            self.screen.blit(ps, (list_rect.right - ps.get_width() - 4,
-                                  y + (line_h - ps.get_height()) // 2))
+        self._blit_stripes(rows_key, list_rect, len(items), scroll, line_h)
+        # Highlights go first; every row's text then goes out in one blits() call
+        fill    = self.screen.fill
+        render  = self._render_cached
+        font    = self.tiny_font
+        offered_bg, gold = _OFFERED_BG, BRIGHT_GOLD
+        lx, lw  = list_rect.x, list_rect.w
+        top     = list_rect.y - scroll
+        name_x  = lx + 4
+        price_r = list_rect.right - 4
+        batch   = []
+        append  = batch.append
+        for i in range(first, last):
+            y = top + i * line_h
+            label, ns, ps, pw, name_dy, price_dy = rows[i]
+            if id(items[i]) in in_barter:
+                fill(offered_bg, (lx, y, lw, line_h))
+                ns = render(font, label, gold)
+            append((ns, (name_x, y + name_dy)))
+            append((ps, (price_r - pw, y + price_dy)))
+        self._blit_batch(batch)
         self.screen.set_clip(clip)
 
-    def _draw_barter_panel(self, panel: pygame.Rect, list_rect: pygame.Rect,
-                           title: str, items: List[GameEquipment], scroll: int) -> None:
-        s      = self._scale
-        line_h = _sc(24, s)
-        pygame.draw.rect(self.screen, (22, 20, 10), panel, border_radius=6)
-        pygame.draw.rect(self.screen, GOLD,          panel, width=1, border_radius=6)
-        t = self.tiny_font.render(title, True, BRIGHT_GOLD)
-        self.screen.blit(t, (panel.x + 4, panel.y + 2))
-
+    def _draw_barter_panel(self, list_rect: pygame.Rect, items: List[GameEquipment],
+                           scroll: int, rows_key: str) -> None:
+        line_h = self._line_h
+        first  = max(0, scroll // line_h)
+        last   = min(len(items), (scroll + list_rect.height) // line_h + 2)
+        rows = self._list_rows(rows_key, items, 20, first, last,
+                               (self._trade.barter_version,))
         clip = self.screen.get_clip()
         self.screen.set_clip(list_rect)
-        for i, it in enumerate(items):
-            y = list_rect.y + i * line_h - scroll
-            if y + line_h < list_rect.y or y > list_rect.bottom:
-                continue
-            bg = DARK_GRAY if i % 2 == 0 else (35, 35, 35)
-            pygame.draw.rect(self.screen, bg, (list_rect.x, y, list_rect.w, line_h))
-            ns = self.tiny_font.render((it.name or it.index or "?")[:20], True, WHITE)
-            self.screen.blit(ns, (list_rect.x + 4, y + (line_h - ns.get_height()) // 2))
-            ps = self.tiny_font.render(f"{it.price or 0}cp", True, LIGHT_GRAY)
-            self.screen.blit(ps, (list_rect.right - ps.get_width() - 4,
-                                  y + (line_h - ps.get_height()) // 2))
+        self._blit_stripes(rows_key, list_rect, len(items), scroll, line_h)
+        top     = list_rect.y - scroll
+        name_x  = list_rect.x + 4
+        price_r = list_rect.right - 4
+        batch   = []
+        append  = batch.append
+        for i in range(first, last):
+            _, ns, ps, pw, name_dy, price_dy = rows[i]
+            y = top + i * line_h
+            append((ns, (name_x, y + name_dy)))
+            append((ps, (price_r - pw, y + price_dy)))
+        self._blit_batch(batch)
         self.screen.set_clip(clip)
 
     def _draw_equip_panel(self) -> None:
-        s = self._scale
-        pl_barter_ids = {id(it) for it in self._trade.player_barter}
-        pygame.draw.rect(self.screen, MODAL_BG, self._equip_panel, border_radius=6)
-        pygame.draw.rect(self.screen, GOLD,     self._equip_panel, width=1, border_radius=6)
-        t = self.tiny_font.render("Экипировка", True, GOLD)
-        self.screen.blit(t, (self._equip_panel.x + 4, self._equip_panel.y + 2))
-
-        for slot_key, loc_key, _ in SLOTS:
-            r = self._slot_rects.get(slot_key)
-            if not r:
-                continue
-            item      = self._trade.item_in_slot(slot_key)
-            in_barter = item is not None and id(item) in pl_barter_ids
-            bg         = (55, 44, 8) if in_barter else DARK_GRAY
-            border_col = BRIGHT_GOLD if in_barter else (GOLD if item else LIGHT_GRAY)
-            pygame.draw.rect(self.screen, bg,         r, border_radius=3)
-            pygame.draw.rect(self.screen, border_col, r, width=1, border_radius=3)
-            if item:
-                label = (item.name or item.index or "")[:16]
-                col   = BRIGHT_GOLD if in_barter else WHITE
-            else:
-                label = _slot_label(loc_key)[:12]
-                col   = (50, 50, 50)
-            ls = self.tiny_font.render(label, True, col)
-            self.screen.blit(ls, ls.get_rect(midleft=(r.x + 4, r.centery)))
+        pl_barter_ids = self._trade.player_barter_ids
+        equipped      = self._trade.slot_map()
+        slot_rects    = self._slot_rects
+        chrome        = self._slot_chrome
+        render        = self._render_cached
+        item_label    = self._item_label
+        font          = self.tiny_font
+        gold, white   = BRIGHT_GOLD, WHITE
+
+        batch  = []
+        append = batch.append
+        for slot_key, _, _ in SLOTS:
+            item = equipped.get(slot_key)
+            r    = slot_rects.get(slot_key) if item is not None else None
+            if r is None:
+                continue  # empty-slot chrome is baked into the background
+            in_barter = id(item) in pl_barter_ids
+            ls = render(font, item_label(item, 16, ""), gold if in_barter else white)
+            append((chrome[in_barter], r.topleft))
+            append((ls, ls.get_rect(midleft=(r.x + 4, r.centery))))
+        self._blit_batch(batch)
 
     def _draw_desc_panel(self) -> None:
-        s       = self._scale
+        screen  = self.screen
+        render  = self._render_cached
         panel   = self._desc_panel
         content = self._desc_content_rect
 
@@ -696,25 +1045,26 @@ class TradeScreen(BaseScreen):
         item       = self._selected_item if pinned else self._hovered_item
         border_col = BRIGHT_GOLD if pinned else GOLD
 
-        pygame.draw.rect(self.screen, MODAL_BG,   panel, border_radius=6)
-        pygame.draw.rect(self.screen, border_col, panel, width=1, border_radius=6)
-        title_surf = self.tiny_font.render("Описание", True, border_col)
-        self.screen.blit(title_surf, (panel.x + 4, panel.y + 2))
+        pygame.draw.rect(screen, MODAL_BG,   panel, border_radius=6)
+        pygame.draw.rect(screen, border_col, panel, width=1, border_radius=6)
+        title_surf = render(self.tiny_font, "Описание", border_col)
+        screen.blit(title_surf, (panel.x + 4, panel.y + 2))
 
         if not item:
+            hint_y = panel.centery - self._desc_hint_dy
             for i, txt in enumerate(("Кликни или наведи", "на предмет")):
-                h = self.tiny_font.render(txt, True, (80, 80, 80))
-                self.screen.blit(h, h.get_rect(
-                    center=(panel.centerx, panel.centery - _sc(10, s) + i * _sc(18, s))
+                h = render(self.tiny_font, txt, (80, 80, 80))
+                screen.blit(h, h.get_rect(
+                    center=(panel.centerx, hint_y + i * self._desc_hint_step)
                 ))
             return
 
+        name_gap, cost_gap, bottom_pad = self._desc_gaps
+
         # Item name
-        name_surf = self.small_font.render(
-            (item.name or item.index or "?")[:22], True, BRIGHT_GOLD
-        )
-        self.screen.blit(name_surf, (content.x, content.y))
-        name_h = name_surf.get_height() + _sc(4, s)
+        name_surf = render(self.small_font, self._item_label(item, 22), BRIGHT_GOLD)
+        screen.blit(name_surf, (content.x, content.y))
+        name_h = name_surf.get_height() + name_gap
 
         # Cost line
         cost_y   = content.y + name_h
@@ -725,34 +1075,28 @@ class TradeScreen(BaseScreen):
             unit = getattr(cost_obj, "unit", "gp") or "gp"
             cost_str = f"{qty} {unit}" if qty is not None else ""
         if cost_str:
-            cost_surf = self.tiny_font.render(cost_str, True, GOLD)
-            self.screen.blit(cost_surf, (content.x, cost_y))
-            cost_h = cost_surf.get_height() + _sc(3, s)
+            cost_surf = render(self.tiny_font, cost_str, GOLD)
+            screen.blit(cost_surf, (content.x, cost_y))
+            cost_h = cost_surf.get_height() + cost_gap
         else:
             cost_h = 0
 
         # Description text with scroll
-        desc_line_h = _sc(17, s)
+        desc_line_h = self._desc_line_h
         text_top    = cost_y + cost_h
-        text_h      = panel.bottom - text_top - _sc(4, s)
+        text_h      = panel.bottom - text_top - bottom_pad
 
-        raw     = item.desc or ["—"]
-        wrapped = self._wrap_desc(raw, content.w)
+        wrapped = self._desc_lines(item, content.w)
         total_h = len(wrapped) * desc_line_h
         max_s   = max(0, total_h - text_h)
         self._desc_max_scroll = max_s
         self._desc_scroll     = min(self._desc_scroll, max_s)
 
-        clip_rect  = pygame.Rect(panel.x, text_top, panel.w, text_h)
-        saved_clip = self.screen.get_clip()
-        self.screen.set_clip(clip_rect)
-        for i, line in enumerate(wrapped):
-            yy = text_top + i * desc_line_h - self._desc_scroll
-            if yy + desc_line_h < text_top or yy > panel.bottom:
-                continue
-            ls = self.tiny_font.render(line, True, LIGHT_GRAY)
-            self.screen.blit(ls, (content.x, yy))
-        self.screen.set_clip(saved_clip)
+        # Scrolling is just a different slice of the pre-rendered sheet
+        if text_h > 0:
+            sheet = self._desc_sheet_for(item, wrapped, content.w)
+            screen.blit(sheet, (content.x, text_top),
+                        (0, self._desc_scroll, panel.right - content.x, text_h))
 
         if max_s > 0:
             sb_x    = panel.right - SB_W - SB_PAD
@@ -760,8 +1104,8 @@ class TradeScreen(BaseScreen):
             vis_r   = text_h / max(1, total_h)
             thumb_h = max(16, int(track.h * vis_r))
             thumb_y = track.y + int((self._desc_scroll / max_s) * (track.h - thumb_h))
-            pygame.draw.rect(self.screen, DARK_GRAY, track, border_radius=3)
-            pygame.draw.rect(self.screen, GOLD,
+            pygame.draw.rect(screen, DARK_GRAY, track, border_radius=3)
+            pygame.draw.rect(screen, GOLD,
                              pygame.Rect(sb_x, thumb_y, SB_W, thumb_h), border_radius=3)
 
     def _draw_coin_input(self, rect: pygame.Rect, buf: str,
@@ -769,46 +1113,44 @@ class TradeScreen(BaseScreen):
         pygame.draw.rect(self.screen, INPUT_BG, rect, border_radius=4)
         pygame.draw.rect(self.screen, GOLD if active else LIGHT_GRAY,
                          rect, width=2, border_radius=4)
-        lbl = self.tiny_font.render("Монеты: ", True, LIGHT_GRAY)
+        lbl = self._render_cached(self.tiny_font, "Монеты: ", LIGHT_GRAY)
         self.screen.blit(lbl, (rect.x + 6, rect.centery - lbl.get_height() // 2))
         val_str = buf if active else str(value)
         col     = WHITE if active else (GOLD if value > 0 else LIGHT_GRAY)
-        val     = self.small_font.render(val_str or "0", True, col)
+        val     = self._render_cached(self.small_font, val_str or "0", col)
         self.screen.blit(val, (rect.x + lbl.get_width() + 10,
                                 rect.centery - val.get_height() // 2))
 
     # ------------------------------------------------------------------
-    # DRAW
+    # REGION PAINTERS  (each draws only inside its _region_rects entry)
     # ------------------------------------------------------------------
 
-    def draw(self):
-        self.screen.fill(BLACK)
-        self._layout_equip_slots()
+    def _participant_names(self, player, npc) -> Tuple[str, str]:
+        """(player name, npc name); getattr only runs when either object changes."""
+        key = (id(player), id(npc))
+        if key != self._names_key:
+            self._names = (getattr(player, "name", "Игрок") if player else "Игрок",
+                           getattr(npc,    "name", "???")   if npc    else "???")
+            self._names_key = key
+        return self._names
+
+    def _npc_name(self) -> str:
+        return self._participant_names(self._trade.get_player(), self._trade.get_npc())[1]
 
+    def _draw_top_strip(self) -> None:
         trade  = self._trade
         player = trade.get_player()
         npc    = trade.get_npc()
 
-        player_name  = getattr(player, "name",            "Игрок") if player else "Игрок"
-        npc_name     = getattr(npc,    "name",            "???")   if npc    else "???"
-        player_coins = getattr(player, "coins", 0) or 0
-        npc_coins    = getattr(npc,    "coins", 0) or 0
-        player_icon  = getattr(player, "icon_image_path", "")     if player else ""
-        npc_icon     = getattr(npc,    "icon_image_path", "")     if npc    else ""
-
-        # Portraits
-        pl_sz  = (self._player_portrait_rect.w, self._player_portrait_rect.h)
-        npc_sz = (self._npc_portrait_rect.w,    self._npc_portrait_rect.h)
-        self._draw_portrait(self._player_portrait_rect,
-                            self._load_portrait(player_icon, pl_sz) if player_icon else None)
-        self._draw_portrait(self._npc_portrait_rect,
-                            self._load_portrait(npc_icon, npc_sz) if npc_icon else None)
+        player_name, npc_name = self._participant_names(player, npc)
+        player_coins = (player.coins or 0) if player else 0
+        npc_coins    = (npc.coins    or 0) if npc    else 0
 
-        # Name + coins
-        pi = self.small_font.render(f"{player_name}  ·  {player_coins} cp", True, GOLD)
-        self.screen.blit(pi, pi.get_rect(center=self._player_info_rect.center))
-        ni = self.small_font.render(f"{npc_name}  ·  {npc_coins} cp", True, GOLD)
-        self.screen.blit(ni, ni.get_rect(center=self._npc_info_rect.center))
+        # Name + coins (portraits live in the background surface)
+        render = self._render_cached
+        font   = self.small_font
+        pi = render(font, f"{player_name}  ·  {player_coins} cp", GOLD)
+        ni = render(font, f"{npc_name}  ·  {npc_coins} cp", GOLD)
 
         # Barter value indicators
         balanced  = trade.is_balanced()
@@ -816,42 +1158,43 @@ class TradeScreen(BaseScreen):
         nv        = trade.npc_barter_value()
         val_col_p = BRIGHT_GOLD if balanced else (WHITE if pv > 0 else LIGHT_GRAY)
         val_col_n = BRIGHT_GOLD if balanced else (WHITE if nv > 0 else LIGHT_GRAY)
-        pvs = self.small_font.render(f"↓ {pv} cp", True, val_col_p)
-        nvs = self.small_font.render(f"↓ {nv} cp", True, val_col_n)
-        self.screen.blit(pvs, pvs.get_rect(center=self._barter_val_player_rect.center))
-        self.screen.blit(nvs, nvs.get_rect(center=self._barter_val_npc_rect.center))
-
-        # Equipment panel
-        self._draw_equip_panel()
-
-        # Player inventory
-        pl_items   = trade.player_inv_items()
-        pl_offered = {id(it) for it in trade.player_barter}
+        pvs = render(font, f"↓ {pv} cp", val_col_p)
+        nvs = render(font, f"↓ {nv} cp", val_col_n)
+
+        # The four labels never overlap, so they go out in one call
+        self._blit_batch((
+            (pi,  pi.get_rect(center=self._player_info_rect.center)),
+            (ni,  ni.get_rect(center=self._npc_info_rect.center)),
+            (pvs, pvs.get_rect(center=self._barter_val_player_rect.center)),
+            (nvs, nvs.get_rect(center=self._barter_val_npc_rect.center)),
+        ))
+
+    def _draw_player_inv(self) -> None:
         self._draw_item_list(
-            self._player_inv_panel, self._player_inv_rect,
-            "Инвентарь", pl_items, self._player_inv_scroll, pl_offered
+            self._player_inv_rect, self._trade.player_inv_items(), self._player_inv_scroll,
+            self._trade.player_barter_ids, PANEL_PLAYER_INV
         )
 
-        # NPC inventory
-        npc_items   = trade.npc_inv_items()
-        npc_offered = {id(it) for it in trade.npc_barter}
+    def _draw_npc_inv(self) -> None:
         self._draw_item_list(
-            self._npc_inv_panel, self._npc_inv_rect,
-            f"Инвентарь {npc_name[:14]}", npc_items, self._npc_inv_scroll, npc_offered
+            self._npc_inv_rect, self._trade.npc_inv_items(), self._npc_inv_scroll,
+            self._trade.npc_barter_ids, PANEL_NPC_INV
         )
 
-        # Barter lists
+    def _draw_player_barter(self) -> None:
         self._draw_barter_panel(
-            self._player_barter_panel, self._player_barter_rect,
-            "← Ваше предложение", trade.player_barter, self._player_barter_scroll
+            self._player_barter_rect, self._trade.player_barter,
+            self._player_barter_scroll, PANEL_PLAYER_BARTER
         )
+
+    def _draw_npc_barter(self) -> None:
         self._draw_barter_panel(
-            self._npc_barter_panel, self._npc_barter_rect,
-            f"{npc_name[:12]} →", trade.npc_barter, self._npc_barter_scroll
+            self._npc_barter_rect, self._trade.npc_barter,
+            self._npc_barter_scroll, PANEL_NPC_BARTER
         )
 
-        # Description panel
-        self._draw_desc_panel()
+    def _draw_bottom_strip(self) -> None:
+        trade = self._trade
 
         # Coin inputs
         self._draw_coin_input(self._player_coin_input_rect,
@@ -861,46 +1204,122 @@ class TradeScreen(BaseScreen):
                               trade.coin_buf_npc, trade.npc_coins_offer,
                               trade.coin_active == "npc")
 
-        # Buttons
-        if self._balance_btn:
-            self._balance_btn.draw(self.screen)
-        if self._barter_btn:
-            self._barter_btn.draw(self.screen)
-            if not balanced:
-                dim = pygame.Surface(
-                    (self._barter_btn.rect.w, self._barter_btn.rect.h), pygame.SRCALPHA)
-                dim.fill((0, 0, 0, 150))
-                self.screen.blit(dim, self._barter_btn.rect.topleft)
-        if self._leave_btn:
-            self._leave_btn.draw(self.screen)
-
-        # Drag ghost + drop-zone highlights
-        if self._drag_item:
-            valid_ids: Set[int] = set()
-            if self._drag_source in (PANEL_PLAYER_INV, PANEL_PLAYER_EQUIP):
-                valid_ids = {id(self._player_barter_panel)}
-            elif self._drag_source == PANEL_PLAYER_BARTER:
-                valid_ids = {id(self._player_inv_panel), id(self._equip_panel)}
-            elif self._drag_source == PANEL_NPC_INV:
-                valid_ids = {id(self._npc_barter_panel)}
-            elif self._drag_source == PANEL_NPC_BARTER:
-                valid_ids = {id(self._npc_inv_panel)}
-
-            for panel in (self._equip_panel, self._player_inv_panel,
-                          self._player_barter_panel, self._npc_barter_panel,
-                          self._npc_inv_panel):
-                is_valid = id(panel) in valid_ids
-                color    = (60, 200, 80) if is_valid else (200, 60, 60)
-                surf     = pygame.Surface((panel.w, panel.h), pygame.SRCALPHA)
-                surf.fill((*color, 55))
-                self.screen.blit(surf, panel.topleft)
-                pygame.draw.rect(self.screen, color, panel, width=2, border_radius=6)
-
-            label = (self._drag_item.name or self._drag_item.index or "?")[:26]
+        self._draw_balance_btn()
+        self._draw_barter_btn()
+        self._draw_leave_btn()
+
+    def _draw_balance_btn(self) -> None:
+        self._balance_btn.draw(self.screen)
+
+    def _draw_barter_btn(self) -> None:
+        self._barter_btn.draw(self.screen)
+        if not self._trade.is_balanced():
+            self.screen.blit(self._barter_dim, self._barter_btn.rect.topleft)
+
+    def _draw_leave_btn(self) -> None:
+        self._leave_btn.draw(self.screen)
+
+    def _build_drop_overlay(self, source: str) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Compose the drop-zone highlight for *source* into one translucent surface."""
+        valid_ids = self._valid_drop_ids.get(source, frozenset())
+        panels = (self._equip_panel, self._player_inv_panel,
+                  self._player_barter_panel, self._npc_barter_panel,
+                  self._npc_inv_panel)
+        bounds = panels[0].unionall(panels[1:])
+        surf   = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for panel in panels:
+            color, rgba = _DROP_VALID if id(panel) in valid_ids else _DROP_INVALID
+            local = panel.move(-bounds.x, -bounds.y)
+            surf.fill(rgba, local)
+            pygame.draw.rect(surf, color, local, width=2, border_radius=6)
+        return surf, bounds.topleft
+
+    def _draw_drop_zones(self) -> None:
+        overlay = self._drop_overlays.get(self._drag_source)
+        if overlay is None:
+            overlay = self._drop_overlays[self._drag_source] = \
+                self._build_drop_overlay(self._drag_source)
+        self.screen.blit(*overlay)
+
+    def _draw_drag_ghost(self) -> pygame.Rect:
+        """Draw the dragged item's label at the cursor; return the on-screen rect."""
+        if self._ghost_key != id(self._drag_item) or self._ghost_surf is None:
+            label = self._item_label(self._drag_item, 26)
             gs    = self.small_font.render(label, True, WHITE)
             gb    = pygame.Surface((gs.get_width() + 14, gs.get_height() + 6), pygame.SRCALPHA)
             gb.fill((20, 20, 20, 215))
-            gx = self._drag_pos[0] + 14
-            gy = self._drag_pos[1] - gb.get_height() // 2
-            self.screen.blit(gb, (gx, gy))
-            self.screen.blit(gs, (gx + 7, gy + 3))
+            gb.blit(gs, (7, 3))
+            self._ghost_surf = gb
+            self._ghost_key  = id(self._drag_item)
+        gb = self._ghost_surf
+        self._ghost_pos = self._drag_pos
+        gx = self._drag_pos[0] + 14
+        gy = self._drag_pos[1] - gb.get_height() // 2
+        return self.screen.blit(gb, (gx, gy)).clip(self.screen.get_rect())
+
+    # ------------------------------------------------------------------
+    # DRAW
+    # ------------------------------------------------------------------
+
+    def draw(self):
+        """
+        Repaint stale regions only.  Returns the rects that changed (empty
+        when idle) for pygame.display.update, or None after a full repaint.
+        """
+        # Nothing changed since the last frame: the display still shows it
+        if not (self._full_redraw or self._dirty):
+            if not self._drag_item or (self._drag_backdrop_ok
+                                       and self._drag_pos == self._ghost_pos):
+                return []
+
+        if self._bg_surface is None:
+            self._build_background()
+        bg = self._bg_surface
+
+        if self._drag_item:
+            return self._draw_dragging(bg)
+
+        if self._full_redraw or len(self._dirty) > MAX_DIRTY_REGIONS:
+            self._draw_full(bg)
+            return None
+
+        rects = []
+        for key in self._dirty:
+            rect = self._region_rects[key]
+            self.screen.set_clip(rect)
+            self.screen.blit(bg, rect, rect)
+            self._region_painters[key]()
+            rects.append(rect)
+        self.screen.set_clip(None)
+        self._dirty.clear()
+        return rects
+
+    def _draw_full(self, bg: pygame.Surface) -> None:
+        self.screen.blit(bg, (0, 0))
+        for paint in self._full_painters:
+            paint()
+        self._full_redraw = False
+        self._dirty.clear()
+
+    def _draw_dragging(self, bg: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """
+        The drop-zone tint covers every panel, so the first drag frame (or any
+        frame where state changed) repaints fully and snapshots the result.
+        Later frames only move the ghost: restore its old rect, draw the new one.
+        """
+        if self._full_redraw or self._dirty or not self._drag_backdrop_ok:
+            self._draw_full(bg)
+            self._draw_drop_zones()
+            size = self.screen.get_size()
+            if self._drag_backdrop is None or self._drag_backdrop.get_size() != size:
+                self._drag_backdrop = pygame.Surface(size)
+            self._drag_backdrop.blit(self.screen, (0, 0))
+            self._drag_backdrop_ok = True
+            self._ghost_rect = self._draw_drag_ghost()
+            return None
+
+        old = self._ghost_rect
+        if old is not None:
+            self.screen.blit(self._drag_backdrop, old, old)
+        self._ghost_rect = self._draw_drag_ghost()
+        return [old, self._ghost_rect] if old is not None else [self._ghost_rect]
@@ -7,19 +7,45 @@
 Использование:
     python update_dnd_e5_data.py           # Скачать только новые файлы
     python update_dnd_e5_data.py --force   # Перескачать всё
+    pypy3 update_dnd_e5_data.py            # Тот же запуск под PyPy: обход JSON быстрее
+                                           # (нужен requests в окружении pypy3)
 """
 import argparse
 import json
 import os
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
 import requests
 from pathlib import Path
 
+# orjson (если установлен) в разы быстрее stdlib json на тысячах файлов
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Конфигурация
 API_BASE_URL = "https://www.dnd5eapi.co"
 API_VERSION = "/api/2014"
+API_URL_PREFIX = f"{API_VERSION}/"  # Префикс ссылок на другие ресурсы API
 PATH_TO_DATA = Path("./dnd_5e_data/api/2014")
-REQUEST_DELAY = 0.001  # Пауза между запросами (50ms)
+# Граф ссылок {url: {"mtime": ..., "links": [...]}} для повторных запусков.
+# Локальный кэш: лежит вне дерева API и не коммитится (см. .gitignore)
+LINKS_CACHE_PATH = PATH_TO_DATA.parent.parent / ".links_cache.json"
+REQUEST_DELAY = 0.001  # Минимальный интервал между запросами (общий для всех потоков)
+MAX_WORKERS = 16  # Параллельные загрузки
+
+# requests.Session не потокобезопасна: у каждого рабочего потока своя
+_thread_state = threading.local()
+_sessions: list[requests.Session] = []
+_sessions_lock = threading.Lock()
+# Время, раньше которого нельзя начинать следующий запрос
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
 
 
 def ensure_dir(path: Path) -> None:
@@ -30,6 +56,11 @@ def ensure_dir(path: Path) -> None:
 def save_json(data: dict, local_path: Path) -> None:
     """Сохраняет JSON в файл с красивым форматированием."""
     ensure_dir(local_path)
+    if ORJSON_AVAILABLE:
+        local_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        return
     with open(local_path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
@@ -37,34 +68,52 @@ def save_json(data: dict, local_path: Path) -> None:
 def load_json(local_path: Path) -> dict | None:
     """Загружает JSON из файла. Возвращает None если файл невалидный."""
     try:
+        if ORJSON_AVAILABLE:
+            # orjson.JSONDecodeError наследует json.JSONDecodeError
+            return orjson.loads(local_path.read_bytes())
         with open(local_path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (json.JSONDecodeError, FileNotFoundError, IOError):
         return None
 
 
-def fetch_json(url: str) -> dict | None:
-    """Скачивает JSON по URL."""
-    try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.RequestException as e:
-        print(f"  [ERROR] Failed to download {url}: {e}")
-        return None
+def thread_session() -> requests.Session:
+    """keep-alive сессия текущего потока (создаётся при первом вызове)."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = _thread_state.session = requests.Session()
+        with _sessions_lock:
+            _sessions.append(session)
+    return session
+
 
+def close_sessions() -> None:
+    """Закрывает сессии всех рабочих потоков."""
+    with _sessions_lock:
+        for session in _sessions:
+            session.close()
+        _sessions.clear()
 
-def is_api_reference(obj) -> bool:
+
+def throttle() -> None:
+    """Выдерживает REQUEST_DELAY между началами запросов во всех потоках."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + REQUEST_DELAY
+    if start > now:
+        time.sleep(start - now)
+
+
+def fetch_json(url: str, session: requests.Session | None = None) -> dict:
     """
-    Проверяет, является ли объект ссылкой на другой ресурс API.
-    Ссылки обычно имеют поля 'url' и 'index' или 'url' и 'name'.
+    Скачивает JSON по URL (через session, если она передана).
+    Ошибки сети/HTTP/JSON пробрасываются как requests.RequestException.
     """
-    if not isinstance(obj, dict):
-        return False
-    if "url" not in obj:
-        return False
-    url = obj.get("url", "")
-    return isinstance(url, str) and url.startswith("/api/2014/")
+    response = (session or requests).get(url, timeout=30)
+    response.raise_for_status()
+    return response.json()
 
 
 def url_to_filepath(api_url: str) -> Path:
@@ -93,34 +142,26 @@ def filepath_to_url(filepath: Path) -> str | None:
         return None
 
 
-def is_api_url_string(value) -> bool:
-    """Проверяет, является ли значение строкой-ссылкой на API."""
-    return isinstance(value, str) and value.startswith("/api/2014/")
-
-
-def extract_api_urls(obj) -> set[str]:
+def extract_api_urls(root) -> set[str]:
     """
-    Рекурсивно извлекает все URL ссылок на API из объекта.
+    Извлекает все URL ссылок на API из объекта за один проход
+    (явный стек вместо рекурсии, одно общее множество).
     Поддерживает два формата:
     1. Объекты с полем "url": {"url": "/api/2014/...", "index": "..."}
     2. Простые строки: "/api/2014/..."
+    Поле "url" - тоже значение словаря, поэтому оба формата
+    сводятся к проверке строк.
     """
     urls = set()
-    
-    if isinstance(obj, dict):
-        if is_api_reference(obj):
-            urls.add(obj["url"])
-        for value in obj.values():
-            if is_api_url_string(value):
-                urls.add(value)
-            else:
-                urls.update(extract_api_urls(value))
-    elif isinstance(obj, list):
-        for item in obj:
-            urls.update(extract_api_urls(item))
-    elif is_api_url_string(obj):
-        urls.add(obj)
-    
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, str) and obj.startswith(API_URL_PREFIX):
+            urls.add(obj)
     return urls
 
 
@@ -133,14 +174,36 @@ def scan_existing_files() -> dict[str, Path]:
     if not PATH_TO_DATA.exists():
         return existing
     
-    for json_file in PATH_TO_DATA.rglob("*.json"):
-        url = filepath_to_url(json_file)
-        if url:
-            existing[url] = json_file
+    # os.scandir отдаёт тип записи без отдельного stat на каждый файл
+    stack = [str(PATH_TO_DATA)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    json_file = Path(entry.path)
+                    url = filepath_to_url(json_file)
+                    if url:
+                        existing[url] = json_file
     
     return existing
 
 
+def file_mtime(local_path: Path) -> int | None:
+    """mtime файла в наносекундах или None, если файла нет."""
+    try:
+        return local_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _download(api_url: str) -> dict:
+    """Загрузка одного URL в рабочем потоке (вывод и ошибки - в главном потоке)."""
+    throttle()
+    return fetch_json(f"{API_BASE_URL}{api_url}", thread_session())
+
+
 def download_all_data(force: bool = False):
     """Основная функция для скачивания всех данных из API."""
     print("=" * 60)
@@ -158,71 +221,94 @@ def download_all_data(force: bool = False):
     print("Scanning existing files...")
     existing_files = scan_existing_files()
     print(f"Found {len(existing_files)} existing files")
+    # Ссылки из файлов, не изменившихся с прошлого запуска, берём без разбора JSON
+    links_cache = {} if force else (load_json(LINKS_CACHE_PATH) or {})
+    print(f"Cached link lists: {len(links_cache)}")
     print("=" * 60)
     
     # Множество для отслеживания уже обработанных URL
     seen_urls: set[str] = set()
     # Очередь URL для обработки
-    queue: list[str] = [API_VERSION]
+    queue: deque[str] = deque([API_VERSION])
+    # Загрузки в полёте: future -> URL
+    in_flight: dict = {}
     
     downloaded_count = 0
     skipped_count = 0
     
-    while queue:
-        current_url = queue.pop(0)
-        
-        # Пропускаем уже обработанные в этой сессии
-        if current_url in seen_urls:
-            continue
-        seen_urls.add(current_url)
-        
-        # Путь для сохранения
-        local_path = url_to_filepath(current_url)
-        
-        # Проверяем, есть ли уже файл и валидный ли он
-        if not force and current_url in existing_files:
-            # Пробуем загрузить и проверить валидность JSON
-            data = load_json(local_path)
-            if data is not None:
-                # Файл существует и валидный - пропускаем скачивание
-                skipped_count += 1
-                # Но всё равно извлекаем ссылки для обхода
-                new_urls = extract_api_urls(data)
-                for url in new_urls:
-                    if url not in seen_urls:
-                        queue.append(url)
-                continue
-            else:
-                # Файл повреждён - перескачаем
-                print(f"  [INVALID] Corrupted file, redownloading: {current_url}")
-        
-        # Скачиваем данные
-        print(f"  [GET] Downloading: {current_url}")
-        full_url = f"{API_BASE_URL}{current_url}"
-        data = fetch_json(full_url)
-        
-        if data is None:
-            continue
-        
-        # Сохраняем
-        save_json(data, local_path)
-        downloaded_count += 1
-        
-        # Обновляем словарь существующих файлов
-        existing_files[current_url] = local_path
-        
-        # Извлекаем все вложенные ссылки и добавляем в очередь
-        new_urls = extract_api_urls(data)
-        for url in new_urls:
+    def enqueue_links(api_url: str, local_path: Path, data: dict) -> None:
+        """Извлекает вложенные ссылки, запоминает их в кэше и добавляет новые в очередь."""
+        links = sorted(extract_api_urls(data))
+        links_cache[api_url] = {"mtime": file_mtime(local_path), "links": links}
+        for url in links:
             if url not in seen_urls:
                 queue.append(url)
-        
-        # Небольшая пауза между запросами
-        time.sleep(REQUEST_DELAY)
-        
-        # Показываем прогресс каждые 50 файлов
-        if downloaded_count % 50 == 0:
-            print(f"  [PROGRESS] Downloaded: {downloaded_count}, in queue: {len(queue)}")
+    
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            while queue or in_flight:
+                # Разбираем очередь, пока есть место под новые загрузки
+                while queue and len(in_flight) < 2 * MAX_WORKERS:
+                    current_url = queue.popleft()
+                    
+                    # Пропускаем уже обработанные в этой сессии
+                    if current_url in seen_urls:
+                        continue
+                    seen_urls.add(current_url)
+                    
+                    # Проверяем, есть ли уже файл и валидный ли он
+                    if not force and current_url in existing_files:
+                        local_path = url_to_filepath(current_url)
+                        cached = links_cache.get(current_url)
+                        if cached and cached.get("mtime") == file_mtime(local_path):
+                            # Файл не менялся - ссылки уже известны
+                            skipped_count += 1
+                            queue.extend(u for u in cached["links"] if u not in seen_urls)
+                            continue
+                        # Пробуем загрузить и проверить валидность JSON
+                        data = load_json(local_path)
+                        if data is not None:
+                            # Файл существует и валидный - пропускаем скачивание,
+                            # но всё равно извлекаем ссылки для обхода
+                            skipped_count += 1
+                            enqueue_links(current_url, local_path, data)
+                            continue
+                        # Файл повреждён - перескачаем
+                        print(f"  [INVALID] Corrupted file, redownloading: {current_url}")
+                    
+                    in_flight[pool.submit(_download, current_url)] = current_url
+                
+                if not in_flight:
+                    continue
+                
+                # Ждём хотя бы одну загрузку; сохранение и обход ссылок - в главном потоке
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_url = in_flight.pop(future)
+                    try:
+                        data = future.result()
+                    except requests.RequestException as e:
+                        print(f"  [ERROR] Failed to download {current_url}: {e}")
+                        continue
+                    print(f"  [GET] Downloaded: {current_url}")
+                    
+                    # Сохраняем
+                    local_path = url_to_filepath(current_url)
+                    save_json(data, local_path)
+                    downloaded_count += 1
+                    
+                    # Обновляем словарь существующих файлов
+                    existing_files[current_url] = local_path
+                    
+                    enqueue_links(current_url, local_path, data)
+                    
+                    # Показываем прогресс каждые 50 файлов
+                    if downloaded_count % 50 == 0:
+                        print(f"  [PROGRESS] Downloaded: {downloaded_count}, in queue: {len(queue)}")
+    finally:
+        close_sessions()
+        # Сохраняем граф ссылок даже при прерывании (Ctrl+C)
+        save_json(links_cache, LINKS_CACHE_PATH)
     
     print("=" * 60)
     print("DONE!")